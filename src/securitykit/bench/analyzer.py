@@ -5,6 +5,11 @@ from typing import Sequence, Any, Callable, Iterable, Optional
 from securitykit.hashing.interfaces import BenchValue
 from .engine import BenchmarkResult
 
+try:  # Optional vectorized path (bench extra); pure-Python fallback below.
+    import numpy as _np
+except ImportError:  # pragma: no cover - depends on environment
+    _np = None
+
 
 def _is_number(x: Any) -> bool:
     return isinstance(x, (int, float))
@@ -36,9 +41,20 @@ class ResultAnalyzer:
         tolerance: float,
     ) -> list[BenchmarkResult]:
         lower, upper = target_ms * (1 - tolerance), target_ms * (1 + tolerance)
+        if _np is not None and len(results) > 64:
+            medians = _np.fromiter(
+                (r.median for r in results), dtype=_np.float64, count=len(results)
+            )
+            mask = (medians >= lower) & (medians <= upper)
+            return [results[i] for i in _np.flatnonzero(mask)]
         return [r for r in results if lower <= r.median <= upper]
 
     def closest(self, results: Sequence[BenchmarkResult], target_ms: int) -> BenchmarkResult:
+        if _np is not None and len(results) > 64:
+            medians = _np.fromiter(
+                (r.median for r in results), dtype=_np.float64, count=len(results)
+            )
+            return results[int(_np.argmin(_np.abs(medians - target_ms)))]
         return min(results, key=lambda r: abs(r.median - target_ms))
 
     def balanced(self, results: Sequence[BenchmarkResult]) -> BenchmarkResult:
@@ -7,12 +7,12 @@ from dataclasses import dataclass, field
 from securitykit.hashing.algorithm import Algorithm
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BenchmarkResult:
     """Immutable container for benchmark results of one policy config."""
 
     policy: Any
-    times: list[float]
+    times: tuple[float, ...]
     target_ms: int
 
     median: float = field(init=False)
@@ -22,6 +22,9 @@ class BenchmarkResult:
     delta: float = field(init=False)
 
     def __post_init__(self):
+        # Accept any sequence (callers historically pass lists); store as
+        # an immutable tuple to match the frozen container.
+        object.__setattr__(self, "times", tuple(self.times))
         object.__setattr__(self, "median", statistics.median(self.times))
         object.__setattr__(self, "min", min(self.times))
         object.__setattr__(self, "max", max(self.times))
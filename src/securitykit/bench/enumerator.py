@@ -9,11 +9,14 @@ class PolicyEnumerator:
     def __init__(self, policy_cls: type, schema: Mapping[str, list[Any]]):
         self.policy_cls = policy_cls
         self.schema = schema
+        # Flatten once: generate() re-walks the product for every sweep and
+        # large grids would otherwise rebuild these lists per call.
+        self._param_names = tuple(schema.keys())
+        self._param_values = tuple(map(tuple, schema.values()))
 
     def generate(self) -> Iterator[object]:
         """Yield all policy instances from schema combinations."""
-        param_names = list(self.schema.keys())
-        param_values = list(self.schema.values())
-        for values in itertools.product(*param_values):
-            params = dict(zip(param_names, values))
-            yield self.policy_cls(**params)
+        names = self._param_names
+        policy_cls = self.policy_cls
+        for values in itertools.product(*self._param_values):
+            yield policy_cls(**dict(zip(names, values)))
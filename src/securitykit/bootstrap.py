@@ -14,8 +14,6 @@ from dotenv import load_dotenv
 
 from securitykit.logging_config import logger
 from securitykit.hashing.policy_registry import get_policy_class
-from securitykit.bench.config import BenchmarkConfig
-from securitykit.bench.runner import BenchmarkRunner
 from securitykit.utils.env import export_env
 from securitykit.version import __version__
 from securitykit import config as sk_config
@@ -33,11 +31,14 @@ def _env(name: str) -> str:
     return os.getenv(sk_config.ENV_VARS[name], sk_config.DEFAULTS.get(name, ""))
 
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
 def _bool_flag(name: str) -> bool:
     """
     Boolean interpretation (1/true/yes/on).
     """
-    return _env(name).lower() in ("1", "true", "yes", "on")
+    return _env(name).lower() in _TRUTHY
 
 
 # ---------------------------------------------------------------------------
@@ -64,20 +65,48 @@ def _sha256_of(config: dict[str, str]) -> str:
     return hashlib.sha256(blob).hexdigest()
 
 
-def _validate_generated_block(path: Path):
-    """Check integrity of an existing .env.local (GENERATED_SHA256)."""
-    if not path.exists():
-        return
+# Parsed .env.local cache keyed on (mtime_ns, size): repeated bootstrap
+# calls in one process (each import / explicit ensure_env_config()) would
+# otherwise re-read and re-parse an unchanged file per call. Keyed per
+# resolved path so chdir-ing tests do not cross-talk.
+_ENV_LOCAL_CACHE: dict[str, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
+def _read_env_file(path: Path) -> dict[str, str] | None:
+    """
+    Return the key/value pairs of a generated env file, or None if the
+    file is missing/unreadable. Results are cached per path and
+    invalidated by mtime/size, so the unchanged-file path costs one stat.
+    """
+    cache_key = str(path.resolve())
     try:
-        content = path.read_text().splitlines()
+        st = os.stat(path)
+    except OSError:
+        _ENV_LOCAL_CACHE.pop(cache_key, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _ENV_LOCAL_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    try:
+        lines = path.read_text().splitlines()
     except Exception:
-        return
+        return None
     kv: dict[str, str] = {}
-    for line in content:
+    for line in lines:
         if not line or line.startswith("#") or "=" not in line:
             continue
         k, v = line.split("=", 1)
         kv[k.strip()] = v.strip()
+    _ENV_LOCAL_CACHE[cache_key] = (stamp, kv)
+    return kv
+
+
+def _validate_generated_block(path: Path):
+    """Check integrity of an existing .env.local (GENERATED_SHA256)."""
+    kv = _read_env_file(path)
+    if kv is None:
+        return
     recorded = kv.get("GENERATED_SHA256")
     if not recorded:
         return
@@ -137,8 +166,10 @@ def ensure_env_config():
     required_prefix = variant.upper() + "_"
     required_keys = [f"{required_prefix}{field.upper()}" for field in bench_schema.keys()]
 
-    present = [k for k in required_keys if k in os.environ]
-    missing = [k for k in required_keys if k not in os.environ]
+    present: list[str] = []
+    missing: list[str] = []
+    for k in required_keys:
+        (present if k in os.environ else missing).append(k)
 
     # Case 1: everything already present
     if not missing:
@@ -184,6 +215,11 @@ def ensure_env_config():
             )
         )
 
+        # Imported here so the bench machinery (runner, tqdm, …) is only
+        # paid for when an auto-benchmark actually runs.
+        from securitykit.bench.config import BenchmarkConfig
+        from securitykit.bench.runner import BenchmarkRunner
+
         try:
             # BenchmarkConfig (as previously patched) neutralizes pepper internally
             # if you adopted the neutralize_pepper flag; otherwise bench/bench.py
@@ -211,6 +247,8 @@ def ensure_env_config():
         env_config["GENERATED_SHA256"] = _sha256_of(env_config)
 
         export_env(env_config, export_path)
+        # Drop any stale parse of the file we just rewrote.
+        _ENV_LOCAL_CACHE.pop(str(export_path.resolve()), None)
         os.environ.update(env_config)
         logger.info(
             "Generated %s hashing config → %s (target=%d ms)",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Any, Mapping
+import logging
 import os
 
 from securitykit.hashing.algorithm_registry import get_algorithm_class
@@ -7,6 +8,15 @@ from securitykit.exceptions import HashingError, VerificationError
 from securitykit.logging_config import logger
 from securitykit.transform.pepper import apply_pepper
 
+# Known encoded-hash prefixes per variant. Lets verify() reject hashes that
+# cannot belong to the configured variant without paying full KDF cost
+# (important during algorithm migrations). Unknown variants are not listed
+# and always go through the implementation.
+_HASH_PREFIXES: dict[str, tuple[str, ...]] = {
+    "argon2": ("$argon2",),
+    "bcrypt": ("$2a$", "$2b$", "$2y$"),
+}
+
 
 class Algorithm:
     """
@@ -25,6 +35,7 @@ class Algorithm:
         policy: Any = None,
         *,
         config: Mapping[str, Any] | None = None,
+        constant_time: bool = False,
         **kwargs: Any,
     ):
         algo_cls = get_algorithm_class(variant)
@@ -34,7 +45,13 @@ class Algorithm:
         self.impl = algo_cls(policy, **params, **kwargs)
         self.variant = variant.lower()
         self.policy = getattr(self.impl, "policy", None)
-        logger.debug("Algorithm initialized variant=%s", self.variant)
+        # Opt-in: balance verify() rejection timing against real KDF cost.
+        self._constant_time = constant_time
+        self._dummy_hash: str | None = None
+        # isEnabledFor guard skips argument packing + handler dispatch when
+        # debug logging is off (the common case for short-lived façades).
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Algorithm initialized variant=%s", self.variant)
 
     # ---- internal helpers -------------------------------------------------
 
@@ -53,13 +70,36 @@ class Algorithm:
             return self.impl.verify_raw(stored_hash, peppered)  # type: ignore[attr-defined]
         return self.impl.verify(stored_hash, peppered)  # type: ignore[no-any-return]
 
+    def _reject(self, password: str) -> bool:
+        """
+        Uniform failure return for verify() short-circuits.
+
+        In constant_time mode the rejection still pays one full KDF
+        verification against a cached dummy hash, so callers cannot
+        distinguish 'malformed/missing input' from 'wrong password' by
+        timing. The fast default skips this entirely.
+        """
+        if self._constant_time:
+            dummy = self._dummy_hash
+            if dummy is None:
+                dummy = self._dummy_hash = self._hash_delegate(
+                    self._pepper("timing-balance")
+                )
+            try:
+                self._verify_delegate(dummy, self._pepper(password or "x"))
+            except Exception:  # pragma: no cover (defensive)
+                pass
+        return False
+
     # ---- public façade ----------------------------------------------------
 
     def hash(self, password: str) -> str:
+        if not password:
+            raise HashingError("Password cannot be empty")
+        # Pepper application never raises (noop fallback), so only the
+        # delegate call needs the exception wrapper.
+        peppered = self._pepper(password)
         try:
-            if not password:
-                raise HashingError("Password cannot be empty")
-            peppered = self._pepper(password)
             return self._hash_delegate(peppered)
         except HashingError:
             raise
@@ -67,10 +107,13 @@ class Algorithm:
             raise HashingError(f"Failed to hash password with {self.variant}: {e}") from e
 
     def verify(self, stored_hash: str, password: str) -> bool:
+        if not stored_hash or not password:
+            return self._reject(password)
+        prefixes = _HASH_PREFIXES.get(self.variant)
+        if prefixes and not stored_hash.startswith(prefixes):
+            return self._reject(password)
+        peppered = self._pepper(password)
         try:
-            if not stored_hash or not password:
-                return False
-            peppered = self._pepper(password)
             return self._verify_delegate(stored_hash, peppered)
         except VerificationError:
             raise
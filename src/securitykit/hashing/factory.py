@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import itertools
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Mapping
 
 from securitykit import config
@@ -26,6 +30,7 @@ class HashingFactory:
         self._config_map = config_map
         self._loader = ConfigLoader(config_map)
         self._policy_cache: dict[str, PolicyProtocol] = {}
+        self._algorithm: Algorithm | None = None
 
     def _resolve_variant(self) -> str:
         """
@@ -72,10 +77,82 @@ class HashingFactory:
 
     def get_algorithm(self) -> Algorithm:
         """
-        Construct the Algorithm façade with the resolved policy.
-        The entire configuration mapping is forwarded so the pepper pipeline
-        and any future config-driven behaviors can access PEPPER_* and other keys.
+        Construct (or fetch cached) the Algorithm façade with the resolved
+        policy. The entire configuration mapping is forwarded so the pepper
+        pipeline and any future config-driven behaviors can access PEPPER_*
+        and other keys. The façade is stateless per config, so one instance
+        per factory suffices; build a new factory to pick up config changes
+        (as reload_configuration does).
+        """
+        if self._algorithm is None:
+            variant = self._resolve_variant()
+            policy = self.get_policy(variant)
+            self._algorithm = Algorithm(
+                variant=variant, policy=policy, config=self._config_map
+            )
+        return self._algorithm
+
+    def _get_benchmark_algorithm(self) -> Algorithm:
+        """
+        Benchmark-only façade: requests bench_mode from implementations that
+        support it (currently Argon2), falling back to the normal construction
+        otherwise. bench_mode sacrifices security properties for throughput
+        and MUST NOT be used outside the benchmark subsystem.
         """
         variant = self._resolve_variant()
         policy = self.get_policy(variant)
-        return Algorithm(variant=variant, policy=policy, config=self._config_map)
+        try:
+            return Algorithm(
+                variant=variant, policy=policy, config=self._config_map, bench_mode=True
+            )
+        except TypeError:
+            return Algorithm(variant=variant, policy=policy, config=self._config_map)
+
+    def bench_sweep(
+        self,
+        variant: str,
+        *,
+        rounds: int = 3,
+        max_workers: int | None = None,
+    ) -> dict[tuple[Any, ...], float]:
+        """
+        Time every BENCH_SCHEMA combination for `variant` in parallel.
+
+        Returns {schema-value tuple: median ms}. Points run on a thread
+        pool: the underlying KDFs (argon2, bcrypt) release the GIL, so
+        threads give near-linear wall-clock reduction without the pickling
+        constraints of process pools. Pepper is neutralized so timings
+        reflect raw hashing cost. For target-driven tuning use the bench
+        subsystem (BenchmarkRunner); this is a raw grid sweep.
+        """
+        from securitykit.bench.exceptions import MissingBenchSchemaError
+
+        load_all()
+        policy_cls = get_policy_class(variant)
+        schema = getattr(policy_cls, "BENCH_SCHEMA", None)
+        if not schema:
+            raise MissingBenchSchemaError(
+                f"Policy '{variant}' cannot be benchmarked (missing BENCH_SCHEMA)."
+            )
+
+        keys = list(schema.keys())
+        config = {"PEPPER_ENABLED": "false"}
+
+        def timed_point(values: tuple[Any, ...]) -> tuple[tuple[Any, ...], float]:
+            policy = policy_cls(**dict(zip(keys, values)))
+            try:
+                algo = Algorithm(
+                    variant=variant, policy=policy, config=config, bench_mode=True
+                )
+            except TypeError:
+                algo = Algorithm(variant=variant, policy=policy, config=config)
+            times: list[float] = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                algo.hash("benchmark-password")
+                times.append((time.perf_counter() - start) * 1000)
+            return values, statistics.median(times)
+
+        points = list(itertools.product(*schema.values()))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return dict(pool.map(timed_point, points))
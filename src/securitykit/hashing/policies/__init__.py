@@ -0,0 +1,9 @@
+"""
+Built-in hashing policy modules.
+
+__all__ doubles as the discovery manifest: registry.load_all() imports
+these names directly instead of scanning the package directory. Keep it
+in sync when adding a policy module.
+"""
+
+__all__ = ["argon2", "bcrypt"]
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from typing import ClassVar, Any
 from securitykit.hashing.policy_registry import register_policy
 from securitykit.hashing.interfaces import BenchValue
@@ -25,8 +25,69 @@ ARGON2_MAX_MEMORY = 256 * 1024  # 256 MiB = unusually high for web apps
 ARGON2_MAX_PARALLELISM = 4  # >4 can cause resource strain
 
 
+def validate_policy_fields(
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+    hash_length: int,
+    salt_length: int,
+) -> tuple[list[str], list[str]]:
+    """
+    Pure bounds check for Argon2 policy fields.
+
+    Returns (errors, warnings) as message lists: errors are hard-minimum
+    violations (construction must fail), warnings flag values outside the
+    recommended envelope. Kept free of dataclass/logging machinery so it
+    can be unit-tested and reused directly.
+    """
+    errors: list[str] = []
+    warnings: list[str] = []
+
+    # --- Hard bounds ---
+    if time_cost < ARGON2_MIN_TIME_COST:
+        errors.append(f"time_cost must be >= {ARGON2_MIN_TIME_COST}")
+    if memory_cost < ARGON2_MIN_MEMORY:
+        errors.append(f"memory_cost must be >= {ARGON2_MIN_MEMORY} KiB")
+    if parallelism < ARGON2_MIN_PARALLELISM:
+        errors.append(f"parallelism must be >= {ARGON2_MIN_PARALLELISM}")
+    if hash_length < ARGON2_MIN_HASH_LENGTH:
+        errors.append(f"hash_length must be >= {ARGON2_MIN_HASH_LENGTH}")
+    if salt_length < ARGON2_MIN_SALT_LENGTH:
+        errors.append(f"salt_length must be >= {ARGON2_MIN_SALT_LENGTH}")
+
+    # --- Below recommended baselines ---
+    if time_cost < ARGON2_RECOMMENDED_TIME_COST:
+        warnings.append(
+            f"Argon2 time_cost {time_cost} below recommended ({ARGON2_RECOMMENDED_TIME_COST})"
+        )
+    if memory_cost < ARGON2_RECOMMENDED_MEMORY:
+        warnings.append(
+            f"Argon2 memory_cost {memory_cost} below recommended ({ARGON2_RECOMMENDED_MEMORY})"
+        )
+    if parallelism <= ARGON2_RECOMMENDED_PARALLELISM:
+        warnings.append(
+            f"Argon2 parallelism {parallelism} at/below recommended ({ARGON2_RECOMMENDED_PARALLELISM})"
+        )
+    if hash_length < ARGON2_RECOMMENDED_HASH_LENGTH:
+        warnings.append(
+            f"Argon2 hash_length {hash_length} below recommended ({ARGON2_RECOMMENDED_HASH_LENGTH})"
+        )
+
+    # --- Above maximum recommended ---
+    if time_cost > ARGON2_MAX_TIME_COST:
+        warnings.append(f"Argon2 time_cost {time_cost} very high (> {ARGON2_MAX_TIME_COST})")
+    if memory_cost > ARGON2_MAX_MEMORY:
+        warnings.append(f"Argon2 memory_cost {memory_cost} very high (> {ARGON2_MAX_MEMORY})")
+    if parallelism > ARGON2_MAX_PARALLELISM:
+        warnings.append(
+            f"Argon2 parallelism {parallelism} unusually high (> {ARGON2_MAX_PARALLELISM})"
+        )
+
+    return errors, warnings
+
+
 @register_policy("argon2")
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Argon2Policy:
     ENV_PREFIX: ClassVar[str] = "ARGON2_"
     BENCH_SCHEMA: ClassVar[dict[str, list[BenchValue]]] = {
@@ -41,36 +102,39 @@ class Argon2Policy:
     hash_length: int = ARGON2_RECOMMENDED_HASH_LENGTH
     salt_length: int = ARGON2_MIN_SALT_LENGTH
 
+    # Serialized form, precomputed in __post_init__ (slot must be declared).
+    _dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Copy of the dict precomputed in __post_init__ (asdict() would
+        # deep-copy via dataclasses machinery on every call).
+        return dict(self._dict)
 
     def __post_init__(self):
-        # --- Hard bounds ---
-        if self.time_cost < ARGON2_MIN_TIME_COST:
-            raise InvalidPolicyConfig(f"time_cost must be >= {ARGON2_MIN_TIME_COST}")
-        if self.memory_cost < ARGON2_MIN_MEMORY:
-            raise InvalidPolicyConfig(f"memory_cost must be >= {ARGON2_MIN_MEMORY} KiB")
-        if self.parallelism < ARGON2_MIN_PARALLELISM:
-            raise InvalidPolicyConfig(f"parallelism must be >= {ARGON2_MIN_PARALLELISM}")
-        if self.hash_length < ARGON2_MIN_HASH_LENGTH:
-            raise InvalidPolicyConfig(f"hash_length must be >= {ARGON2_MIN_HASH_LENGTH}")
-        if self.salt_length < ARGON2_MIN_SALT_LENGTH:
-            raise InvalidPolicyConfig(f"salt_length must be >= {ARGON2_MIN_SALT_LENGTH}")
-
-        # --- Warnings: below recommended baselines ---
-        if self.time_cost < ARGON2_RECOMMENDED_TIME_COST:
-            logger.warning("Argon2 time_cost %d below recommended (%d)", self.time_cost, ARGON2_RECOMMENDED_TIME_COST)
-        if self.memory_cost < ARGON2_RECOMMENDED_MEMORY:
-            logger.warning("Argon2 memory_cost %d below recommended (%d)", self.memory_cost, ARGON2_RECOMMENDED_MEMORY)
-        if self.parallelism <= ARGON2_RECOMMENDED_PARALLELISM:
-            logger.warning("Argon2 parallelism %d at/below recommended (%d)", self.parallelism, ARGON2_RECOMMENDED_PARALLELISM)
-        if self.hash_length < ARGON2_RECOMMENDED_HASH_LENGTH:
-            logger.warning("Argon2 hash_length %d below recommended (%d)", self.hash_length, ARGON2_RECOMMENDED_HASH_LENGTH)
-
-        # --- Warnings: above maximum recommended ---
-        if self.time_cost > ARGON2_MAX_TIME_COST:
-            logger.warning("Argon2 time_cost %d very high (> %d)", self.time_cost, ARGON2_MAX_TIME_COST)
-        if self.memory_cost > ARGON2_MAX_MEMORY:
-            logger.warning("Argon2 memory_cost %d very high (> %d)", self.memory_cost, ARGON2_MAX_MEMORY)
-        if self.parallelism > ARGON2_MAX_PARALLELISM:
-            logger.warning("Argon2 parallelism %d unusually high (> %d)", self.parallelism, ARGON2_MAX_PARALLELISM)
+        errors, warnings = validate_policy_fields(
+            self.time_cost,
+            self.memory_cost,
+            self.parallelism,
+            self.hash_length,
+            self.salt_length,
+        )
+        if errors:
+            raise InvalidPolicyConfig(errors[0])
+        for msg in warnings:
+            logger.warning(msg)
+
+        # Precompute the serialized form once (frozen dataclass → values
+        # fixed; flat scalars need no asdict recursion).
+        object.__setattr__(
+            self,
+            "_dict",
+            {
+                "time_cost": self.time_cost,
+                "memory_cost": self.memory_cost,
+                "parallelism": self.parallelism,
+                "hash_length": self.hash_length,
+                "salt_length": self.salt_length,
+            },
+        )
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from typing import ClassVar, Any
 from securitykit.hashing.policy_registry import register_policy
 from securitykit.hashing.interfaces import BenchValue
@@ -11,7 +11,7 @@ BCRYPT_RECOMMENDED_ROUNDS = 12
 BCRYPT_MAX_ROUNDS = 18
 
 @register_policy("bcrypt")
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BcryptPolicy:
     ENV_PREFIX: ClassVar[str] = "BCRYPT_"
     BENCH_SCHEMA: ClassVar[dict[str, list[BenchValue]]] = {
@@ -20,8 +20,15 @@ class BcryptPolicy:
 
     rounds: int = BCRYPT_RECOMMENDED_ROUNDS
 
+    # Serialized form, precomputed in __post_init__ (slot must be declared).
+    _dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        # Copy of the dict precomputed in __post_init__ (asdict() would
+        # deep-copy via dataclasses machinery on every call).
+        return dict(self._dict)
 
     def __post_init__(self):
         if self.rounds < BCRYPT_MIN_ROUNDS:
@@ -30,3 +37,7 @@ class BcryptPolicy:
             logger.warning("bcrypt rounds %d unusually high (> %d)", self.rounds, BCRYPT_MAX_ROUNDS)
         if self.rounds < BCRYPT_RECOMMENDED_ROUNDS:
             logger.warning("bcrypt rounds %d below recommended (%d)", self.rounds, BCRYPT_RECOMMENDED_ROUNDS)
+
+        # Precompute the serialized form once (frozen dataclass → values
+        # fixed; flat scalars need no asdict recursion).
+        object.__setattr__(self, "_dict", {"rounds": self.rounds})
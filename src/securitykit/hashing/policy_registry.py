@@ -1,11 +1,22 @@
 from __future__ import annotations
-from typing import Dict, Type
+from types import MappingProxyType
+from typing import Dict, Mapping, Type
 
 from securitykit.exceptions import RegistryConflictError, UnknownPolicyError
 
 _POLICIES: Dict[str, Type] = {}
 _SNAPSHOTS: Dict[str, Type] = {}
 
+# Cached views, rebuilt lazily after any registry mutation. Keeps the
+# list/items helpers allocation-free when called inside loops.
+_KEYS_VIEW: tuple[str, ...] | None = None
+_CLASSES_VIEW: Mapping[str, Type] = MappingProxyType(_POLICIES)
+
+
+def _invalidate_views() -> None:
+    global _KEYS_VIEW
+    _KEYS_VIEW = None
+
 
 def register_policy(name: str):
     norm = name.lower()
@@ -19,29 +30,43 @@ def register_policy(name: str):
         _POLICIES[norm] = cls
         if norm not in _SNAPSHOTS:
             _SNAPSHOTS[norm] = cls
+        _invalidate_views()
         return cls
 
     return decorator
 
 
 def get_policy_class(name: str) -> Type:
-    cls = _POLICIES.get(name.lower())
+    norm = name.lower()
+    cls = _POLICIES.get(norm)
+    if cls is None:
+        # On-demand import of the single backing module (avoids eager
+        # discovery of every backend for one lookup).
+        from securitykit.hashing.registry import load_variant
+
+        if load_variant(norm):
+            cls = _POLICIES.get(norm)
     if cls is None:
         raise UnknownPolicyError(f"Unknown policy variant '{name}'")
     return cls
 
 
-def list_policies() -> list[str]:
-    return sorted(_POLICIES.keys())
+def list_policies() -> tuple[str, ...]:
+    global _KEYS_VIEW
+    if _KEYS_VIEW is None:
+        _KEYS_VIEW = tuple(sorted(_POLICIES))
+    return _KEYS_VIEW
 
 
-def list_policy_classes() -> dict[str, Type]:
-    return dict(_POLICIES)
+def list_policy_classes() -> Mapping[str, Type]:
+    # Read-only live view of the registry (no copy per call).
+    return _CLASSES_VIEW
 
 
 def restore_from_snapshots() -> None:
     _POLICIES.clear()
     _POLICIES.update(_SNAPSHOTS)
+    _invalidate_views()
 
 
 __all__ = [
@@ -16,8 +16,49 @@ from securitykit.logging_config import logger
 
 _DISCOVERED = False
 
+# Static variant → module map for on-demand loading. Lets a lookup of a
+# single variant import only its policy/algorithm modules instead of
+# paying full package discovery (and every backend import) up front.
+# load_all() remains the batch path for CLI/tests that need everything.
+_VARIANT_MODULES: dict[str, tuple[str, ...]] = {
+    "argon2": (
+        "securitykit.hashing.policies.argon2",
+        "securitykit.hashing.algorithms.argon2",
+    ),
+    "bcrypt": (
+        "securitykit.hashing.policies.bcrypt",
+        "securitykit.hashing.algorithms.bcrypt",
+    ),
+}
+
+
+def load_variant(name: str) -> bool:
+    """
+    Import the modules backing a single built-in variant.
+
+    Returns True if the variant is known to the static map (imports are
+    attempted, failures logged), False for unknown names so callers can
+    fall through to their registry miss handling.
+    """
+    modules = _VARIANT_MODULES.get(name.lower())
+    if not modules:
+        return False
+    for full in modules:
+        try:
+            importlib.import_module(full)
+        except Exception as e:  # pragma: no cover
+            logger.error("Failed to import submodule %s: %s", full, e)
+    return True
+
 
 def _iter_children(pkg) -> Iterable[str]:
+    # Prefer the package's __all__ manifest: no filesystem scan needed.
+    # Fall back to pkgutil for packages without one (e.g. extensions).
+    manifest = getattr(pkg, "__all__", None)
+    if manifest:
+        for mod_name in manifest:
+            yield f"{pkg.__name__}.{mod_name}"
+        return
     for _, mod_name, _ in pkgutil.iter_modules(pkg.__path__):
         yield f"{pkg.__name__}.{mod_name}"
 
@@ -15,15 +15,21 @@ class PasswordFactory:
     def __init__(self, config: Mapping[str, Any]):
         self.config = config
         self.loader = ConfigLoader(config)
+        self._policy: PasswordPolicy | None = None
+        self._validator: PasswordValidator | None = None
 
     def get_policy(self) -> PasswordPolicy:
-        """Build PasswordPolicy from config."""
-        return self.loader.build(
-            PasswordPolicy,
-            prefix="PASSWORD_",
-            name="PasswordPolicy",
-        )
+        """Build (or fetch cached) PasswordPolicy from config."""
+        if self._policy is None:
+            self._policy = self.loader.build(
+                PasswordPolicy,
+                prefix="PASSWORD_",
+                name="PasswordPolicy",
+            )
+        return self._policy
 
     def get_validator(self) -> PasswordValidator:
-        """Return a PasswordValidator for enforcing the policy."""
-        return PasswordValidator(self.get_policy())
+        """Return a (cached) PasswordValidator for enforcing the policy."""
+        if self._validator is None:
+            self._validator = PasswordValidator(self.get_policy())
+        return self._validator
@@ -1,22 +1,32 @@
 # securitykit/password/policy.py
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from typing import Any, ClassVar
 from securitykit.exceptions import InvalidPolicyConfig
 from securitykit.logging_config import logger
 
+# Module-level bounds (the ClassVar mirrors below stay for callers/tests
+# that address them through the class).
+PASSWORD_MIN_LENGTH = 1
+PASSWORD_MAX_LENGTH = 4096
+PASSWORD_RECOMMENDED_MIN_LENGTH = 12
+PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH = 128
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PasswordPolicy:
     """
     Password policy definition.
     Holds configuration + static validation of parameters.
     Does NOT validate actual passwords (see PasswordValidator).
+
+    Frozen + slotted: instances are immutable, carry no __dict__, and
+    attribute reads on the validator hot path resolve via slot descriptors.
     """
 
-    PASSWORD_MIN_LENGTH: ClassVar[int] = 1
-    PASSWORD_MAX_LENGTH: ClassVar[int] = 4096
-    PASSWORD_RECOMMENDED_MIN_LENGTH: ClassVar[int] = 12
-    PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH: ClassVar[int] = 128
+    PASSWORD_MIN_LENGTH: ClassVar[int] = PASSWORD_MIN_LENGTH
+    PASSWORD_MAX_LENGTH: ClassVar[int] = PASSWORD_MAX_LENGTH
+    PASSWORD_RECOMMENDED_MIN_LENGTH: ClassVar[int] = PASSWORD_RECOMMENDED_MIN_LENGTH
+    PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH: ClassVar[int] = PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH
 
     min_length: int = 8
     require_upper: bool = True
@@ -24,28 +34,48 @@ class PasswordPolicy:
     require_digit: bool = True
     require_special: bool = True
 
+    # Lazily cached to_dict() payload; the policy is never mutated after
+    # __post_init__, so the asdict traversal only needs to run once.
+    _cached_dict: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        if self._cached_dict is None:
+            # Explicit literal: the fields are flat scalars, so the
+            # recursive asdict() machinery is unnecessary.
+            object.__setattr__(
+                self,
+                "_cached_dict",
+                {
+                    "min_length": self.min_length,
+                    "require_upper": self.require_upper,
+                    "require_lower": self.require_lower,
+                    "require_digit": self.require_digit,
+                    "require_special": self.require_special,
+                },
+            )
+        return dict(self._cached_dict)
 
     def __post_init__(self):
-        if self.min_length < self.PASSWORD_MIN_LENGTH:
+        if self.min_length < PASSWORD_MIN_LENGTH:
             raise InvalidPolicyConfig(
-                f"Password min_length must be at least {self.PASSWORD_MIN_LENGTH}"
+                f"Password min_length must be at least {PASSWORD_MIN_LENGTH}"
             )
-        if self.min_length > self.PASSWORD_MAX_LENGTH:
+        if self.min_length > PASSWORD_MAX_LENGTH:
             raise InvalidPolicyConfig(
-                f"Password min_length must be <= {self.PASSWORD_MAX_LENGTH}"
+                f"Password min_length must be <= {PASSWORD_MAX_LENGTH}"
             )
 
-        if self.min_length < self.PASSWORD_RECOMMENDED_MIN_LENGTH:
+        if self.min_length < PASSWORD_RECOMMENDED_MIN_LENGTH:
             logger.warning(
                 "Password min_length %d is below recommended minimum (%d).",
                 self.min_length,
-                self.PASSWORD_RECOMMENDED_MIN_LENGTH,
+                PASSWORD_RECOMMENDED_MIN_LENGTH,
             )
-        if self.min_length > self.PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH:
+        if self.min_length > PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH:
             logger.warning(
                 "Password min_length %d is unusually high (> %d). Ensure this is intentional.",
                 self.min_length,
-                self.PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH,
+                PASSWORD_UNUSUALLY_HIGH_MIN_LENGTH,
             )
@@ -1,8 +1,13 @@
 # securitykit/password/validator.py
-import re
 from securitykit.password.policy import PasswordPolicy
 from securitykit.exceptions import InvalidPolicyConfig
 
+# Character-class bits for the single-pass complexity scan.
+_UPPER_BIT = 1
+_LOWER_BIT = 2
+_DIGIT_BIT = 4
+_SPECIAL_BIT = 8
+
 
 class PasswordValidator:
     """
@@ -11,24 +16,56 @@ class PasswordValidator:
 
     def __init__(self, policy: PasswordPolicy):
         self.policy = policy
+        # Policy is immutable: snapshot the bounds once so validate()
+        # reads locals/instance slots instead of attribute chains per call.
+        self._min_length = policy.min_length
+        self._max_length = policy.PASSWORD_MAX_LENGTH
+        # Required classes folded into one mask so the scan can stop as
+        # soon as every required class has been seen.
+        self._required_mask = (
+            (_UPPER_BIT if policy.require_upper else 0)
+            | (_LOWER_BIT if policy.require_lower else 0)
+            | (_DIGIT_BIT if policy.require_digit else 0)
+            | (_SPECIAL_BIT if policy.require_special else 0)
+        )
 
     def validate(self, password: str) -> None:
         """Raise InvalidPolicyConfig if the password violates the policy."""
 
-        if len(password) < self.policy.min_length:
+        length = len(password)
+        if length < self._min_length:
             raise InvalidPolicyConfig(
-                f"Password must be at least {self.policy.min_length} characters long."
+                f"Password must be at least {self._min_length} characters long."
             )
-        if len(password) > self.policy.PASSWORD_MAX_LENGTH:
+        if length > self._max_length:
             raise InvalidPolicyConfig(
-                f"Password too long (max {self.policy.PASSWORD_MAX_LENGTH} characters)."
+                f"Password too long (max {self._max_length} characters)."
             )
 
-        if self.policy.require_upper and not re.search(r"[A-Z]", password):
+        # Single pass with early exit: stop scanning once every required
+        # class has been seen. Classes mirror the original ASCII patterns:
+        # [A-Z], [a-z], [0-9] and "anything else" as special.
+        required = self._required_mask
+        seen = 0
+        if required:
+            for ch in password:
+                if "a" <= ch <= "z":
+                    seen |= _LOWER_BIT
+                elif "A" <= ch <= "Z":
+                    seen |= _UPPER_BIT
+                elif "0" <= ch <= "9":
+                    seen |= _DIGIT_BIT
+                else:
+                    seen |= _SPECIAL_BIT
+                if seen & required == required:
+                    return
+
+        missing = required & ~seen
+        if missing & _UPPER_BIT:
             raise InvalidPolicyConfig("Password must contain at least one uppercase letter.")
-        if self.policy.require_lower and not re.search(r"[a-z]", password):
+        if missing & _LOWER_BIT:
             raise InvalidPolicyConfig("Password must contain at least one lowercase letter.")
-        if self.policy.require_digit and not re.search(r"\d", password):
+        if missing & _DIGIT_BIT:
             raise InvalidPolicyConfig("Password must contain at least one digit.")
-        if self.policy.require_special and not re.search(r"[^A-Za-z0-9]", password):
+        if missing & _SPECIAL_BIT:
             raise InvalidPolicyConfig("Password must contain at least one special character.")
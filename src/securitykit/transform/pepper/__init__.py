@@ -6,7 +6,12 @@ Typical usage from an algorithm:
     from securitykit.transform.pepper import apply_pepper
     transformed = apply_pepper(raw_password, os.environ)
 """
-from .pipeline import apply_pepper
+from .pipeline import apply_pepper, apply_pepper_digest, invalidate_pepper_cache
 from .core import list_strategies
 
-__all__ = ["apply_pepper", "list_strategies"]
+__all__ = [
+    "apply_pepper",
+    "apply_pepper_digest",
+    "invalidate_pepper_cache",
+    "list_strategies",
+]
@@ -6,6 +6,7 @@ invalid frequency) lives here so the parsing layer (ConfigLoader) stays generic.
 """
 from __future__ import annotations
 import hashlib
+from typing import Callable
 
 from securitykit.logging_config import logger
 from securitykit.exceptions import (
@@ -13,66 +14,99 @@ from securitykit.exceptions import (
     UnknownPepperStrategyError,
     PepperStrategyConstructionError,
 )
-from .core import get_strategy_factory
+from .core import PepperStrategy, get_strategy_factory
 from .model import PepperConfig
 from . import strategies  # noqa: F401 (register built-ins)
 
 
-def build_pepper_strategy(cfg: PepperConfig):
-    """
-    Translate PepperConfig into a concrete PepperStrategy instance.
-    Raise Pepper* exceptions for invalid config.
-    """
-    mode = (cfg.mode or "noop").lower()
+def _build_noop(cfg: PepperConfig) -> PepperStrategy:
+    return get_strategy_factory("noop")()
 
-    if not cfg.enabled or mode == "noop":
-        return get_strategy_factory("noop")()
 
+def _build_prefix(cfg: PepperConfig) -> PepperStrategy:
+    return get_strategy_factory("prefix")(prefix=cfg.prefix or cfg.secret or "")
+
+
+def _build_suffix(cfg: PepperConfig) -> PepperStrategy:
+    return get_strategy_factory("suffix")(suffix=cfg.suffix or cfg.secret or "")
+
+
+def _build_prefix_suffix(cfg: PepperConfig) -> PepperStrategy:
     secret = cfg.secret or ""
+    return get_strategy_factory("prefix_suffix")(
+        prefix=cfg.prefix or secret, suffix=cfg.suffix or secret
+    )
+
 
-    if mode == "prefix":
-        return get_strategy_factory("prefix")(prefix=cfg.prefix or secret)
+def _build_interleave(cfg: PepperConfig) -> PepperStrategy:
+    if cfg.interleave_freq <= 0:
+        logger.warning("PEPPER_INTERLEAVE_FREQ <= 0 → falling back to noop")
+        return get_strategy_factory("noop")()
+    token = cfg.interleave_token or cfg.secret or ""
+    return get_strategy_factory("interleave")(
+        token=token, frequency=cfg.interleave_freq
+    )
 
-    if mode == "suffix":
-        return get_strategy_factory("suffix")(suffix=cfg.suffix or secret)
 
-    if mode == "prefix_suffix":
-        return get_strategy_factory("prefix_suffix")(
-            prefix=cfg.prefix or secret, suffix=cfg.suffix or secret
+def _build_blake2(cfg: PepperConfig) -> PepperStrategy:
+    # Reuses PEPPER_HMAC_KEY: same secret role, different keyed primitive.
+    if not cfg.hmac_key:
+        raise PepperConfigError("PEPPER_HMAC_KEY required for blake2 mode")
+    if len(cfg.hmac_key) < 8:
+        logger.warning(
+            "PEPPER_HMAC_KEY is very short (<8 chars) – consider a stronger key."
         )
+    return get_strategy_factory("blake2")(key=cfg.hmac_key.encode("utf-8"))
 
-    if mode == "interleave":
-        if cfg.interleave_freq <= 0:
-            logger.warning("PEPPER_INTERLEAVE_FREQ <= 0 → falling back to noop")
-            return get_strategy_factory("noop")()
-        token = cfg.interleave_token or secret
-        return get_strategy_factory("interleave")(
-            token=token, frequency=cfg.interleave_freq
+
+def _build_hmac(cfg: PepperConfig) -> PepperStrategy:
+    if not cfg.hmac_key:
+        raise PepperConfigError("PEPPER_HMAC_KEY required for hmac mode")
+    if len(cfg.hmac_key) < 8:
+        logger.warning(
+            "PEPPER_HMAC_KEY is very short (<8 chars) – consider a stronger key."
+        )
+    # Early algorithm validation so tests expecting build-time failure pass
+    try:
+        getattr(hashlib, cfg.hmac_algo or "sha256")
+    except AttributeError as e:
+        raise PepperStrategyConstructionError(
+            f"Unsupported HMAC algorithm '{cfg.hmac_algo}'"
+        ) from e
+    try:
+        return get_strategy_factory("hmac")(
+            key=cfg.hmac_key.encode("utf-8"), algo=cfg.hmac_algo or "sha256"
         )
+    except PepperStrategyConstructionError:
+        raise
+    except Exception as e:
+        raise PepperStrategyConstructionError(
+            f"Failed to construct hmac strategy: {e}"
+        ) from e
+
+
+_MODE_BUILDERS: dict[str, Callable[[PepperConfig], PepperStrategy]] = {
+    "noop": _build_noop,
+    "prefix": _build_prefix,
+    "suffix": _build_suffix,
+    "prefix_suffix": _build_prefix_suffix,
+    "interleave": _build_interleave,
+    "hmac": _build_hmac,
+    "blake2": _build_blake2,
+}
+
+
+def build_pepper_strategy(cfg: PepperConfig) -> PepperStrategy:
+    """
+    Translate PepperConfig into a concrete PepperStrategy instance.
+    Raise Pepper* exceptions for invalid config.
+    """
+    mode = (cfg.mode or "noop").lower()
+
+    if not cfg.enabled:
+        return _build_noop(cfg)
 
-    if mode == "hmac":
-        if not cfg.hmac_key:
-            raise PepperConfigError("PEPPER_HMAC_KEY required for hmac mode")
-        if len(cfg.hmac_key) < 8:
-            logger.warning(
-                "PEPPER_HMAC_KEY is very short (<8 chars) – consider a stronger key."
-            )
-        # Early algorithm validation so tests expecting build-time failure pass
-        try:
-            getattr(hashlib, cfg.hmac_algo or "sha256")
-        except AttributeError as e:
-            raise PepperStrategyConstructionError(
-                f"Unsupported HMAC algorithm '{cfg.hmac_algo}'"
-            ) from e
-        try:
-            return get_strategy_factory("hmac")(
-                key=cfg.hmac_key.encode("utf-8"), algo=cfg.hmac_algo or "sha256"
-            )
-        except PepperStrategyConstructionError:
-            raise
-        except Exception as e:
-            raise PepperStrategyConstructionError(
-                f"Failed to construct hmac strategy: {e}"
-            ) from e
-
-    raise UnknownPepperStrategyError(f"Unknown PEPPER_MODE '{cfg.mode}'")
+    builder = _MODE_BUILDERS.get(mode)
+    if builder is None:
+        raise UnknownPepperStrategyError(f"Unknown PEPPER_MODE '{cfg.mode}'")
+    return builder(cfg)
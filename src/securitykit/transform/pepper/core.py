@@ -2,6 +2,8 @@
 Pepper strategy registry & protocol (lazy registration safe).
 """
 from __future__ import annotations
+import sys
+from functools import lru_cache
 from typing import Protocol, ClassVar, Callable, Dict
 
 from securitykit.exceptions import (
@@ -18,6 +20,24 @@ class PepperStrategy(Protocol):
 # Internal strategy registry
 _STRATEGIES: Dict[str, Callable[..., PepperStrategy]] = {}
 
+# Flipped once the built-ins are imported; lets lookups skip the lazy-import
+# call entirely after initialization (a failed import keeps it False so the
+# next lookup retries, preserving the old per-call retry semantics).
+_INITIALIZED = False
+
+
+@lru_cache(maxsize=None)
+def _norm(name: str) -> str:
+    """
+    Normalize a strategy name once per distinct string.
+
+    Interning means registry dict lookups hit pointer equality instead
+    of character comparison; the cache skips the lower() allocation for
+    repeated lookups of the same name (the steady state — mode names
+    come from a small fixed config vocabulary).
+    """
+    return sys.intern(name.lower())
+
 
 def register_strategy(name: str):
     """
@@ -27,7 +47,7 @@ def register_strategy(name: str):
     attempts to reuse the name.
     """
     def decorator(factory: Callable[..., PepperStrategy]):
-        key = name.lower()
+        key = _norm(name)
         existing = _STRATEGIES.get(key)
         if existing is not None and existing is not factory:
             raise PepperStrategyRegistrationError(
@@ -43,25 +63,31 @@ def _lazy_import_strategies() -> None:
     Import default strategies on first lookup to avoid ordering issues
     (e.g. when pipeline is imported before strategies).
     """
+    global _INITIALIZED
     if _STRATEGIES:
+        _INITIALIZED = True
         return
     try:
         from . import strategies  # noqa: F401
     except Exception:
         # Silently ignore – actual lookup will raise UnknownPepperStrategyError
         pass
+    else:
+        _INITIALIZED = True
 
 
 def get_strategy_factory(name: str) -> Callable[..., PepperStrategy]:
-    _lazy_import_strategies()
-    try:
-        return _STRATEGIES[name.lower()]
-    except KeyError as e:
+    if not _INITIALIZED:
+        _lazy_import_strategies()
+    factory = _STRATEGIES.get(_norm(name))
+    if factory is None:
         raise UnknownPepperStrategyError(
             f"Unknown pepper strategy '{name}'. Available={list(_STRATEGIES)}"
-        ) from e
+        )
+    return factory
 
 
 def list_strategies() -> list[str]:
-    _lazy_import_strategies()
+    if not _INITIALIZED:
+        _lazy_import_strategies()
     return list(_STRATEGIES.keys())
@@ -1,13 +1,13 @@
 """
 Dataclass representing normalized pepper configuration as parsed by
-ConfigLoader. All string fields default to empty; logic/validation
+the pipeline. All string fields default to empty; logic/validation
 happens in the builder layer.
 """
 from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PepperConfig:
     enabled: bool = True
     mode: str = "noop"
@@ -1,29 +1,51 @@
 """
 Pepper application pipeline:
 
-1. Parse & cache PepperConfig (via ConfigLoader)
+1. Parse & cache PepperConfig (direct key reads; schema is fixed)
 2. Build (and cache) strategy
 3. Apply strategy
 
 Any PepperError results in a logged message and fallback to NoOp.
 """
 from __future__ import annotations
-from functools import lru_cache
-from typing import Mapping, Any
+import hashlib
+import os
+from typing import Callable, Mapping, Any
 
-from securitykit.utils.config_loader import ConfigLoader
 from securitykit.logging_config import logger
 from securitykit.exceptions import PepperError
 from .model import PepperConfig
 from .builder import build_pepper_strategy
-from .core import PepperStrategy, get_strategy_factory
+from .core import PepperStrategy
 
 PEPPER_PREFIX = "PEPPER_"
 
+# Disabling tokens mirror the ConfigLoader bool conversion ("false"/"off"/
+# "no") plus the falsy values its heuristic parsing produced ("0", "").
+_FALSY = frozenset({"false", "off", "no", "0", ""})
+
 
 def _build_config(mapping: Mapping[str, Any]) -> PepperConfig:
-    loader = ConfigLoader(mapping)
-    return loader.build(PepperConfig, prefix=PEPPER_PREFIX, name="pepper config")
+    """
+    Hand-rolled parse of the nine PEPPER_* keys.
+
+    PepperConfig has a fixed schema, so the generic ConfigLoader path
+    (inspect.signature + get_type_hints per build) is pure overhead here;
+    direct .get() calls keep cache misses cheap. Semantic validation
+    still lives in the builder layer.
+    """
+    get = mapping.get
+    return PepperConfig(
+        enabled=str(get("PEPPER_ENABLED", "true")).strip().lower() not in _FALSY,
+        mode=str(get("PEPPER_MODE", "noop")),
+        secret=str(get("PEPPER_SECRET", "")),
+        prefix=str(get("PEPPER_PREFIX", "")),
+        suffix=str(get("PEPPER_SUFFIX", "")),
+        interleave_freq=int(get("PEPPER_INTERLEAVE_FREQ", "0") or 0),
+        interleave_token=str(get("PEPPER_INTERLEAVE_TOKEN", "")),
+        hmac_key=str(get("PEPPER_HMAC_KEY", "")),
+        hmac_algo=str(get("PEPPER_HMAC_ALGO", "sha256")),
+    )
 
 
 def _snapshot(mapping: Mapping[str, Any]) -> tuple[tuple[str, str], ...]:
@@ -34,18 +56,73 @@ def _snapshot(mapping: Mapping[str, Any]) -> tuple[tuple[str, str], ...]:
     return tuple(sorted(items))
 
 
-@lru_cache(maxsize=1)
-def _cached_strategy(snapshot: tuple[tuple[str, str], ...]) -> PepperStrategy:
+# Fast path for the os.environ singleton: the snapshot scan iterates the
+# entire environment (hundreds of keys) per call, which dominates pepper
+# overhead. The environ-backed applier is cached once and only refreshed
+# via invalidate_pepper_cache() — callers mutating PEPPER_* in os.environ
+# at runtime (e.g. key rotation) must invalidate explicitly. Other
+# mappings keep the per-call snapshot behavior.
+_ENV_APPLIER: Callable[[str], str] | None = None
+
+# Single-entry cache: (snapshot, applier). A plain global beats
+# lru_cache(maxsize=1) here — no lock, no tuple hashing, no linked-list
+# bookkeeping per call; rebinding the tuple is atomic under the GIL.
+_LAST_APPLIER: tuple[tuple[tuple[str, str], ...], Callable[[str], str]] | None = None
+
+
+def invalidate_pepper_cache() -> None:
+    """
+    Drop all cached pepper strategies.
+
+    Required after changing PEPPER_* keys in os.environ at runtime;
+    mappings other than os.environ are re-snapshotted automatically.
+    """
+    global _ENV_APPLIER, _LAST_APPLIER
+    _ENV_APPLIER = None
+    _LAST_APPLIER = None
+
+
+def _identity(password: str) -> str:
+    return password
+
+
+def _specialize(strategy: PepperStrategy) -> Callable[[str], str]:
+    """
+    Collapse a built strategy into a single tight callable.
+
+    The simple string strategies reduce to closures over their captured
+    prefix/suffix, removing the virtual dispatch and per-call attribute
+    loads from the hot path. Anything else (hmac, interleave, custom
+    registrations) falls back to the bound apply method, which still
+    saves one attribute lookup per call.
+    """
+    name = getattr(strategy, "name", "")
+    if name == "noop":
+        return _identity
+    if name == "prefix":
+        prefix = strategy.prefix
+        return lambda password: prefix + password
+    if name == "suffix":
+        suffix = strategy.suffix
+        return lambda password: password + suffix
+    if name == "prefix_suffix":
+        prefix = strategy.prefix
+        suffix = strategy.suffix
+        return lambda password: prefix + password + suffix
+    return strategy.apply
+
+
+def _build_applier(snapshot: tuple[tuple[str, str], ...]) -> Callable[[str], str]:
     mapping = {k: v for k, v in snapshot}
     try:
         cfg = _build_config(mapping)
-        return build_pepper_strategy(cfg)
+        return _specialize(build_pepper_strategy(cfg))
     except PepperError as e:
         logger.error("Pepper strategy failure (%s) → noop fallback", e)
-        return get_strategy_factory("noop")()
+        return _identity
     except Exception as e:  # pragma: no cover (unexpected)
         logger.exception("Unexpected pepper construction error: %s", e)
-        return get_strategy_factory("noop")()
+        return _identity
 
 
 def apply_pepper(
@@ -61,6 +138,39 @@ def apply_pepper(
     if not password:
         return password
 
-    snap = _snapshot(config)
-    strategy = _cached_strategy(snap)
-    return strategy.apply(password)
+    if config is os.environ:
+        global _ENV_APPLIER
+        applier = _ENV_APPLIER
+        if applier is None:
+            applier = _ENV_APPLIER = _build_applier(_snapshot(config))
+    else:
+        global _LAST_APPLIER
+        snapshot = _snapshot(config)
+        last = _LAST_APPLIER
+        if last is not None and last[0] == snapshot:
+            applier = last[1]
+        else:
+            applier = _build_applier(snapshot)
+            _LAST_APPLIER = (snapshot, applier)
+    # No-pepper deployments resolve to the identity applier; skip even
+    # that call and hand the password straight back.
+    if applier is _identity:
+        return password
+    return applier(password)
+
+
+def apply_pepper_digest(
+    password: str,
+    config: Mapping[str, Any],
+) -> bytes:
+    """
+    SHA-256 digest of the peppered password.
+
+    Useful where callers need compact, fixed-size derived material (e.g.
+    cache keys) instead of the variable-length peppered string. Note the
+    Algorithm façade hashes the peppered *string* — switching it to this
+    digest would invalidate existing stored hashes, so it stays opt-in.
+    """
+    return hashlib.sha256(
+        apply_pepper(password, config).encode("utf-8")
+    ).digest()
@@ -13,6 +13,25 @@ from typing import ClassVar
 from securitykit.exceptions import PepperStrategyConstructionError
 from .core import register_strategy, PepperStrategy
 
+# Digest constructors resolved once; construction-time validation becomes a
+# dict membership test instead of hashlib attribute probing per instance
+# (relevant when multi-tenant deployments build many HMAC strategies).
+_DIGESTS = {
+    name: getattr(hashlib, name)
+    for name in (
+        "sha1",
+        "sha224",
+        "sha256",
+        "sha384",
+        "sha512",
+        "sha3_256",
+        "sha3_512",
+        "blake2b",
+        "blake2s",
+    )
+    if hasattr(hashlib, name)
+}
+
 
 @register_strategy("noop")
 @dataclass(frozen=True)
@@ -32,7 +51,7 @@ class PrefixStrategy:
     prefix: str
 
     def apply(self, password: str) -> str:
-        return f"{self.prefix}{password}"
+        return self.prefix + password
 
 
 @register_strategy("suffix")
@@ -43,7 +62,7 @@ class SuffixStrategy:
     suffix: str
 
     def apply(self, password: str) -> str:
-        return f"{password}{self.suffix}"
+        return password + self.suffix
 
 
 @register_strategy("prefix_suffix")
@@ -55,7 +74,7 @@ class PrefixSuffixStrategy:
     suffix: str
 
     def apply(self, password: str) -> str:
-        return f"{self.prefix}{password}{self.suffix}"
+        return self.prefix + password + self.suffix
 
 
 @register_strategy("interleave")
@@ -71,16 +90,54 @@ class InterleaveStrategy:
     def apply(self, password: str) -> str:
         if not self.token or self.frequency <= 0:
             return password
+        # Slice in frequency-sized chunks instead of walking characters:
+        # a token char follows every *full* chunk, cycling through token.
+        freq = self.frequency
+        token = self.token
+        token_len = len(token)
         out = []
         ti = 0
-        for i, ch in enumerate(password):
-            out.append(ch)
-            if (i + 1) % self.frequency == 0:
-                out.append(self.token[ti % len(self.token)])
+        for i in range(0, len(password), freq):
+            chunk = password[i : i + freq]
+            out.append(chunk)
+            if len(chunk) == freq:
+                out.append(token[ti % token_len])
                 ti += 1
         return "".join(out)
 
 
+@register_strategy("blake2")
+@dataclass(frozen=True)
+class Blake2Strategy:
+    """
+    Cryptographic strategy: keyed BLAKE2b(password) → hex digest.
+
+    Equivalent security to HMAC for keyed hashing but a single
+    compression pass (no ipad/opad) with a SIMD-friendly inner loop —
+    the faster choice for new deployments. Kept as its own mode so
+    existing `hmac` configurations keep producing identical output.
+    """
+    name: ClassVar[str] = "blake2"
+    key: bytes
+    digest_size: int = 32
+
+    def __post_init__(self) -> None:
+        if len(self.key) > hashlib.blake2b.MAX_KEY_SIZE:
+            raise PepperStrategyConstructionError(
+                f"BLAKE2b key too long ({len(self.key)} > "
+                f"{hashlib.blake2b.MAX_KEY_SIZE} bytes)"
+            )
+
+    def apply(self, password: str) -> str:
+        if password.isascii():
+            msg = password.encode("ascii")
+        else:
+            msg = password.encode("utf-8")
+        return hashlib.blake2b(
+            msg, key=self.key, digest_size=self.digest_size
+        ).hexdigest()
+
+
 @register_strategy("hmac")
 @dataclass(frozen=True)
 class HmacStrategy:
@@ -91,16 +148,23 @@ class HmacStrategy:
     key: bytes
     algo: str = "sha256"
 
-    def apply(self, password: str) -> str:
-        try:
-            func = getattr(hashlib, self.algo)
-        except AttributeError as e:
+    def __post_init__(self) -> None:
+        # algo is immutable, so validate it once here instead of paying a
+        # getattr + exception guard on every apply(). Uncommon but valid
+        # hashlib algorithms outside the precomputed table still pass.
+        if self.algo not in _DIGESTS and not hasattr(hashlib, self.algo):
             raise PepperStrategyConstructionError(
                 f"Unsupported HMAC algorithm '{self.algo}'"
-            ) from e
-        try:
-            return hmac.new(self.key, password.encode("utf-8"), func).hexdigest()
-        except Exception as e:  # pragma: no cover (defensive)
-            raise PepperStrategyConstructionError(
-                f"Failed HMAC operation: {e}"
-            ) from e
+            )
+
+    def apply(self, password: str) -> str:
+        # hmac.digest() is the one-shot C path (no Python-level HMAC
+        # object, direct OpenSSL call) — markedly faster than
+        # hmac.new(...).hexdigest() for short messages. ASCII passwords
+        # (the common case) take the ascii codec's memcpy path; both
+        # branches produce identical bytes for ASCII input.
+        if password.isascii():
+            msg = password.encode("ascii")
+        else:
+            msg = password.encode("utf-8")
+        return hmac.digest(self.key, msg, self.algo).hex()
@@ -8,22 +8,24 @@ PolicyBuilder: coordinates:
 """
 from __future__ import annotations
 import inspect
-from typing import Any, Type, Dict, get_type_hints
+from typing import Any, Mapping, Type, Dict
 
 from securitykit.logging_config import logger
 from securitykit.exceptions import ConfigValidationError
 
-from .sources import ValueSource
 from .converters import ConverterRegistry
+from .types import cached_signature_params, cached_type_hints
 
 
 class PolicyBuilder:
     """
     Builds a policy-like class by inspecting its __init__ signature
-    (dataclass or plain class) and resolving parameters from a ValueSource.
+    (dataclass or plain class) and resolving parameters from a config
+    mapping. The mapping is used directly — `in` and `.get` are C-level
+    on dict/environ, so no wrapper indirection is needed per key.
     """
 
-    def __init__(self, source: ValueSource, converters: ConverterRegistry):
+    def __init__(self, source: Mapping[str, Any], converters: ConverterRegistry):
         self.source = source
         self.converters = converters
 
@@ -31,14 +33,15 @@ class PolicyBuilder:
         """
         Collect resolved constructor parameter values.
         """
-        params = inspect.signature(policy_cls).parameters
+        params = cached_signature_params(policy_cls)
         resolved: dict[str, Any] = {}
         errors: list[str] = []
 
+        source = self.source
         for pname, param in params.items():
             key = f"{prefix}{pname.upper()}"
-            if self.source.has(key):
-                raw = self.source.get(key)
+            if key in source:
+                raw = source.get(key)
                 try:
                     resolved[pname] = self.converters.convert(raw)
                 except Exception as e:
@@ -62,7 +65,7 @@ class PolicyBuilder:
             )
 
         # Type enforcement (basic) — only primitive scalar checks
-        hints = get_type_hints(policy_cls)
+        hints = cached_type_hints(policy_cls)
         type_errors: list[str] = []
         for field, expected in hints.items():
             if field not in resolved:
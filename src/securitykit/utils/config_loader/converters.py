@@ -8,38 +8,92 @@ Important: Numeric strings like "1" or "0" are NOT treated as booleans.
 Boolean recognition is limited to: true/on/yes and false/off/no.
 """
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Callable, List
 import re
 
 # Boolean tokens (int-like "1"/"0" deliberately excluded to avoid misinterpreting numeric params)
-_BOOL_TRUE = {"true", "on", "yes"}
-_BOOL_FALSE = {"false", "off", "no"}
+_BOOL_MAP = {
+    "true": True,
+    "on": True,
+    "yes": True,
+    "false": False,
+    "off": False,
+    "no": False,
+}
 
+# Covers every valid suffix including bare numbers ("") and "b", so size
+# resolution is a single dict probe instead of two membership tests.
 _SIZE_SUFFIXES = {
-    "k": 1024,
-    "kb": 1024,
-    "m": 1024 * 1024,
-    "mb": 1024 * 1024,
-    "g": 1024 * 1024 * 1024,
-    "gb": 1024 * 1024 * 1024,
+    "": 1,
+    "b": 1,
+    "k": 1 << 10,
+    "kb": 1 << 10,
+    "m": 1 << 20,
+    "mb": 1 << 20,
+    "g": 1 << 30,
+    "gb": 1 << 30,
 }
 
+# Precompiled once: module-level pattern objects dispatch straight into the
+# C-level matcher, skipping the re-cache lookup per call (ConfigLoader runs
+# the converter chain across many keys during startup).
+_SIZE_RE = re.compile(r"\s*([0-9]+)([kKmMgGbB]{0,2})\s*")
+_SPLIT_RE = re.compile(r"[;,]")
+
 
 def _try_size(value: str):
     """
     Try to parse size-like strings: 64k, 32M, 1G, 1024, etc.
     Returns an int or None if not size-like.
     """
-    m = re.fullmatch(r"\s*([0-9]+)([kKmMgGbB]{0,2})\s*", value)
+    m = _SIZE_RE.fullmatch(value)
     if not m:
         return None
     number = int(m.group(1))
-    suffix = m.group(2).lower()
-    if suffix in _SIZE_SUFFIXES:
-        return number * _SIZE_SUFFIXES[suffix]
-    if suffix in ("", "b"):
-        return number
-    return None
+    mult = _SIZE_SUFFIXES.get(m.group(2).lower())
+    if mult is None:
+        return None
+    return number * mult
+
+
+# Sentinel: scalar classification did not recognize the value.
+_MISS: Any = object()
+
+
+@lru_cache(maxsize=256)
+def _parse_scalar(raw: str) -> Any:
+    """
+    Classify a stripped, separator-free string (bool/size/int/float).
+
+    Memoized: env values repeat heavily (the same "true"/"3"/"64M"
+    across rebuilds and tests), and all outputs here are immutable.
+    Returns _MISS when the value should stay a string.
+    """
+    # Single hash lookup covers both truthy and falsy tokens. The
+    # length/first-char gate skips the lower() allocation for values that
+    # cannot be boolean (numbers, passwords, paths — the common case).
+    if 2 <= len(raw) <= 5 and raw[0] in "tTfFoOyYnN":
+        parsed_bool = _BOOL_MAP.get(raw.lower())
+        if parsed_bool is not None:
+            return parsed_bool
+
+    sized = _try_size(raw)
+    if sized is not None:
+        return sized
+
+    # Numeric detection via str.isdigit (tight C loop, no regex state
+    # machine). isascii() keeps the old [0-9]-only semantics — isdigit
+    # alone would also accept non-ASCII digit codepoints.
+    unsigned = raw[1:] if raw.startswith("-") else raw
+    if unsigned and unsigned.isascii():
+        if unsigned.isdigit():
+            return int(raw)
+        head, dot, tail = unsigned.partition(".")
+        if dot and head.isdigit() and tail.isdigit():
+            return float(raw)
+
+    return _MISS
 
 
 def default_parse(value: Any) -> Any:
@@ -57,34 +111,16 @@ def default_parse(value: Any) -> Any:
         return value
 
     raw = value.strip()
-    low = raw.lower()
-
-    if low in _BOOL_TRUE:
-        return True
-    if low in _BOOL_FALSE:
-        return False
-
-    sized = _try_size(raw)
-    if sized is not None:
-        return sized
-
-    if re.fullmatch(r"-?[0-9]+", raw):
-        try:
-            return int(raw)
-        except ValueError:
-            pass
-
-    if re.fullmatch(r"-?[0-9]+\.[0-9]+", raw):
-        try:
-            return float(raw)
-        except ValueError:
-            pass
 
+    # List values are split fresh per call (callers may mutate the result),
+    # so only scalar classification goes through the memoized helper. A
+    # value containing separators can never match the scalar patterns.
     if "," in raw or ";" in raw:
-        parts = re.split(r"[;,]", raw)
+        parts = _SPLIT_RE.split(raw)
         return [p.strip() for p in parts if p.strip()]
 
-    return value
+    parsed = _parse_scalar(raw)
+    return value if parsed is _MISS else parsed
 
 
 class ConverterRegistry:
@@ -95,21 +131,53 @@ class ConverterRegistry:
 
     def __init__(self):
         self._chain: List[Callable[[Any], Any]] = [default_parse]
+        # Bound direct reference while the chain has exactly one converter
+        # (the dominant case) — convert() then skips loop setup entirely.
+        self._single: Callable[[Any], Any] | None = default_parse
+
+    def _sync_single(self) -> None:
+        self._single = self._chain[0] if len(self._chain) == 1 else None
 
     def register_front(self, fn: Callable[[Any], Any]) -> None:
         """
         Register a converter with highest priority (runs first).
         """
         self._chain.insert(0, fn)
+        self._sync_single()
 
     def register_back(self, fn: Callable[[Any], Any]) -> None:
         """
         Register a converter with lowest priority (runs last).
         """
         self._chain.append(fn)
+        self._sync_single()
+
+    @classmethod
+    def default(cls) -> "ConverterRegistry":
+        """
+        Shared default-configured registry.
+
+        Loaders that do not customize conversion can reuse this single
+        instance, keeping its fast-path state warm across loaders. Do
+        not register converters on it — that would silently affect
+        every default-constructed loader; build a private
+        ConverterRegistry() for customization instead.
+        """
+        return _DEFAULT_REGISTRY
 
     def convert(self, raw: Any) -> Any:
+        single = self._single
+        if single is not None:
+            # default_parse no-ops on non-strings; skip the call outright
+            # for pre-parsed values from dict-based config maps.
+            if single is default_parse and not isinstance(raw, str):
+                return raw
+            return single(raw)
         out = raw
         for fn in self._chain:
             out = fn(out)
         return out
+
+
+# Module-level singleton backing ConverterRegistry.default().
+_DEFAULT_REGISTRY = ConverterRegistry()
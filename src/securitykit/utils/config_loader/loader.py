@@ -12,7 +12,6 @@ from __future__ import annotations
 import os
 from typing import Any, Mapping, Type
 
-from .sources import ValueSource
 from .converters import ConverterRegistry
 from .builder import PolicyBuilder
 
@@ -23,8 +22,8 @@ class ConfigLoader:
     """
 
     def __init__(self, config: Mapping[str, Any], converters: ConverterRegistry | None = None):
-        self.source = ValueSource(config)
-        self.converters = converters or ConverterRegistry()
+        self.source = config
+        self.converters = converters or ConverterRegistry.default()
         self._builder = PolicyBuilder(self.source, self.converters)
 
     @classmethod
@@ -3,7 +3,10 @@ Schema export helper for documentation or tooling.
 """
 from __future__ import annotations
 import inspect
-from typing import Any, Type, List, Dict, get_type_hints
+from functools import lru_cache
+from typing import Any, Type, List, Dict
+
+from .types import cached_signature_params, cached_type_hints
 
 
 def export_schema(policy_cls: Type, prefix: str) -> List[Dict[str, Any]]:
@@ -15,26 +18,32 @@ def export_schema(policy_cls: Type, prefix: str) -> List[Dict[str, Any]]:
         required     bool: no default provided
         default      default value or None if required
         type         textual type (from hints if available)
+
+    Results are memoized per (class, prefix) — a class's signature and
+    annotations are immutable at runtime — and copied on return so
+    callers may mutate the rows freely.
     """
-    sig = inspect.signature(policy_cls).parameters
-    hints = get_type_hints(policy_cls)
-    rows: list[dict[str, Any]] = []
-    for pname, param in sig.items():
-        key = f"{prefix}{pname.upper()}"
-        required = param.default is inspect._empty
-        default = None if required else param.default
-        hinted = hints.get(pname, Any)
-        if hasattr(hinted, "__name__"):
-            type_name = hinted.__name__
-        else:
-            type_name = str(hinted)
-        rows.append(
-            {
-                "param": pname,
-                "config_key": key,
-                "required": required,
-                "default": default,
-                "type": type_name,
-            }
-        )
-    return rows
+    return [dict(row) for row in _export_rows(policy_cls, prefix)]
+
+
+@lru_cache(maxsize=128)
+def _export_rows(policy_cls: Type, prefix: str) -> tuple[dict[str, Any], ...]:
+    hints = cached_type_hints(policy_cls)
+    empty = inspect._empty
+    # Flatten to (name, default, hint) triples first so the row loop is a
+    # single comprehension over plain tuples — no Parameter attribute
+    # loads or branching inside the dict construction.
+    params = tuple(
+        (pname, param.default, hints.get(pname, Any))
+        for pname, param in cached_signature_params(policy_cls).items()
+    )
+    return tuple(
+        {
+            "param": pname,
+            "config_key": prefix + pname.upper(),
+            "required": default is empty,
+            "default": None if default is empty else default,
+            "type": getattr(hinted, "__name__", None) or str(hinted),
+        }
+        for pname, default, hinted in params
+    )
@@ -3,6 +3,10 @@ Value source abstractions.
 
 Currently only a simple mapping wrapper.
 Can be extended later (e.g. layered sources or remote lookups).
+
+Note: the internal build path (PolicyBuilder) reads the config mapping
+directly — `in` / `.get` are C-level on dict and os.environ — so this
+wrapper is kept purely as a public extension point.
 """
 from typing import Mapping, Any
 
@@ -6,13 +6,46 @@ Can be extended for:
   - list[T] decomposition
   - future advanced typing logic
 """
-from typing import Any, get_origin, get_args
+import inspect
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, get_origin, get_args, get_type_hints
 
 
+@lru_cache(maxsize=256)
+def cached_type_hints(cls: type) -> dict[str, Any]:
+    """
+    Memoized get_type_hints.
+
+    Class annotations are immutable at runtime, while get_type_hints
+    re-evaluates annotation strings on every call — a known hot spot
+    when the same policy class is rebuilt repeatedly. Callers must not
+    mutate the returned dict.
+    """
+    return get_type_hints(cls)
+
+
+@lru_cache(maxsize=128)
+def cached_signature_params(cls: type) -> MappingProxyType[str, inspect.Parameter]:
+    """
+    Memoized inspect.signature(cls).parameters.
+
+    Signature construction rebuilds Parameter objects on every call;
+    the parameters mapping itself is an immutable proxy, so caching it
+    per class is safe. Same mutation caveat as cached_type_hints.
+    """
+    return inspect.signature(cls).parameters
+
+
+@lru_cache(maxsize=256)
 def normalize_type(t: Any) -> Any:
     """
     Simplify / normalize generic types.
     Currently minimal and returns original or the origin type.
+
+    Cached: typing objects are hashable and immutable, and the universe
+    of types seen here (policy field annotations) is tiny, so repeat
+    calls skip the get_origin isinstance walk.
     """
     origin = get_origin(t)
     if origin is None:
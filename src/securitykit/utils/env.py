@@ -11,6 +11,9 @@ def export_env(config: dict[str, str], filepath: str | Path) -> None:
         config: Dict of environment variables to write.
         filepath: Path to the file to create/overwrite.
     """
-    lines = [f"{k}={v}" for k, v in config.items()]
-    Path(filepath).write_text("\n".join(lines) + "\n")
+    # Generator feeds join directly — no intermediate list of line strings.
+    # write_bytes issues one buffered write of the single encoded blob,
+    # instead of write_text re-encoding through a text wrapper.
+    content = "\n".join(f"{k}={v}" for k, v in config.items()) + "\n"
+    Path(filepath).write_bytes(content.encode("utf-8"))
     logger.info("Exported benchmark config → %s", filepath)
@@ -1,5 +1,8 @@
 import importlib
 
+from ..common.helpers import VALID_PASSWORD
+
+
 def test_password_security_reload_configuration(monkeypatch):
     mod = importlib.import_module("securitykit.api.password_security")
     # Change environment and call reload
@@ -13,5 +16,5 @@ def test_password_security_reload_configuration(monkeypatch):
         "PASSWORD_MIN_LENGTH": "8",
     }
     mod.reload_configuration(new_cfg)
-    h = mod.hash_password("Aa1!abcd!")
-    assert mod.verify_password("Aa1!abcd!", h)
+    h = mod.hash_password(VALID_PASSWORD)
+    assert mod.verify_password(VALID_PASSWORD, h)
@@ -3,11 +3,10 @@ Shared bench test fixtures:
   - Ensure registries discovered for bench package
   - Default tiny Argon2 BENCH_SCHEMA (autouse)
   - Optional helpers to speed/determinize timing in engine/bench tests
-  - Optional helper to reload runner module (to bypass root monkeypatch in specific tests)
 """
 from __future__ import annotations
+import itertools
 import time
-import importlib
 import pytest
 
 from securitykit.hashing.registry import load_all
@@ -56,25 +55,18 @@ def patch_algo_hash(monkeypatch):
 @pytest.fixture
 def patch_perf_counter(monkeypatch):
     """
-    Make time.perf_counter deterministic by incrementing with a fixed delta.
-    Opt-in: only used by tests that request it.
-    """
-    counter = {"v": 1000.0}
+    Make time.perf_counter deterministic by incrementing with a fixed delta
+    (2 ms per call by default, installed immediately).
 
-    def fake_counter():
-        counter["v"] += 0.002  # 2 ms per call
-        return counter["v"]
-
-    monkeypatch.setattr(time, "perf_counter", fake_counter)
-    return fake_counter
+    Returns an installer so tests needing a different stride can call
+    e.g. ``patch_perf_counter(step=0.0005)`` to rebind the counter.
+    The fake is a single next() on a float-stepped count — no per-call
+    arithmetic in the engine's timing loop.
+    """
 
+    def _install(step: float = 0.002):
+        seq = itertools.count(start=1000.0 + step, step=step)
+        monkeypatch.setattr(time, "perf_counter", lambda s=seq: next(s))
 
-@pytest.fixture
-def reload_runner_module():
-    """
-    Reload bench.runner to restore the original class methods for tests that need
-    to re-monkeypatch inside that module's namespace (useful to bypass the root
-    autouse 'forbid_real_benchmark' by reloading/resetting the module).
-    """
-    import securitykit.bench.runner as runner_mod
-    return importlib.reload(runner_mod)
+    _install()
+    return _install
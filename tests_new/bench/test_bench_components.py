@@ -127,6 +127,19 @@ def test_run_benchmark_smoke(monkeypatch, patch_algo_hash, patch_perf_counter):
     assert "time_cost" in line
 
 
+# ---------------------------------------------------------------------------
+# HashingFactory.bench_sweep
+# ---------------------------------------------------------------------------
+
+def test_factory_bench_sweep(patch_algo_hash):
+    from securitykit.hashing.factory import HashingFactory
+
+    # tiny_argon2_schema (autouse) reduces the grid to a single point.
+    sweep = HashingFactory({}).bench_sweep("argon2", rounds=1)
+    assert list(sweep.keys()) == [(2, 64 * 1024, 1)]
+    assert all(ms >= 0 for ms in sweep.values())
+
+
 # ---------------------------------------------------------------------------
 # Balanced variance edge cases
 # ---------------------------------------------------------------------------
@@ -1,4 +1,3 @@
-import importlib
 import logging
 from typing import Any, List
 
@@ -14,10 +13,9 @@ def _ensure_discovery():
 
 
 @pytest.fixture
-def reload_runner_module():
-    import securitykit.bench.runner as runner_mod
-    runner_mod = importlib.reload(runner_mod)
-    return runner_mod
+def runner_module(allow_real_benchmark):
+    """Runner module with the real BenchmarkRunner.run restored (no reload)."""
+    return allow_real_benchmark
 
 
 @pytest.fixture
@@ -34,7 +32,7 @@ def shrink_schema(monkeypatch):
 
 
 @pytest.fixture
-def patch_engine_times(reload_runner_module, monkeypatch):
+def patch_engine_times(runner_module, monkeypatch):
     from securitykit.bench.engine import BenchmarkResult, BenchmarkEngine as RealEngine
 
     def fake_run(self, policy, target_ms: int):
@@ -42,13 +40,13 @@ def patch_engine_times(reload_runner_module, monkeypatch):
         times = [median - 1.0, median, median + 1.0]
         return BenchmarkResult(policy=policy, times=times, target_ms=target_ms)
 
-    monkeypatch.setattr(reload_runner_module, "BenchmarkEngine", RealEngine, raising=True)
+    monkeypatch.setattr(runner_module, "BenchmarkEngine", RealEngine, raising=True)
     monkeypatch.setattr(RealEngine, "run", fake_run, raising=True)
     return fake_run
 
 
 def test_runner_with_near_candidates(
-    reload_runner_module,
+    runner_module,
     shrink_schema,
     patch_engine_times,
     caplog,
@@ -70,7 +68,7 @@ def test_runner_with_near_candidates(
         tolerance=0.40,
         rounds=2,
     )
-    runner = reload_runner_module.BenchmarkRunner(cfg)
+    runner = runner_module.BenchmarkRunner(cfg)
     data = runner.run()
 
     assert set(data.keys()) == {"best", "best_result", "near", "schema_keys"}
@@ -95,11 +93,11 @@ def test_runner_with_near_candidates(
     assert dist_best != dist_remaining
 
     # Log produced
-    assert any("Best config for argon2" in rec.message for rec in caplog.records)
+    assert "Best config for argon2" in caplog.text
 
 
 def test_runner_fallback_to_closest(
-    reload_runner_module,
+    runner_module,
     shrink_schema,
     patch_engine_times,
 ):
@@ -111,14 +109,14 @@ def test_runner_fallback_to_closest(
         tolerance=0.05,  # Window [114,126] includes neither 100 nor 160
         rounds=2,
     )
-    runner = reload_runner_module.BenchmarkRunner(cfg)
+    runner = runner_module.BenchmarkRunner(cfg)
     data = runner.run()
 
     assert data["best_result"].median == 100.0  # closer to 120
     assert data["near"] == []
 
 
-def test_runner_build_env_config_format(reload_runner_module, shrink_schema, patch_engine_times):
+def test_runner_build_env_config_format(runner_module, shrink_schema, patch_engine_times):
     from securitykit.bench.config import BenchmarkConfig
     from securitykit.bench.engine import BenchmarkResult
 
@@ -128,7 +126,7 @@ def test_runner_build_env_config_format(reload_runner_module, shrink_schema, pat
         tolerance=0.10,
         rounds=1,
     )
-    runner = reload_runner_module.BenchmarkRunner(cfg)
+    runner = runner_module.BenchmarkRunner(cfg)
 
     policy = cfg.policy_cls(time_cost=2, memory_cost=64 * 1024, parallelism=1)
     fake_result = BenchmarkResult(policy, times=[100.0, 101.0], target_ms=200)
@@ -139,6 +137,6 @@ def test_runner_build_env_config_format(reload_runner_module, shrink_schema, pat
     assert "ARGON2_PARALLELISM" in env_cfg
 
 
-def test_runner_cartesian_empty_schema(reload_runner_module):
-    out = list(reload_runner_module.BenchmarkRunner._cartesian({}))
+def test_runner_cartesian_empty_schema(runner_module):
+    out = list(runner_module.BenchmarkRunner._cartesian({}))
     assert out == []
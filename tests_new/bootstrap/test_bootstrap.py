@@ -11,6 +11,18 @@ from securitykit.hashing.policies.argon2 import Argon2Policy
 # Fixtures (unique to bootstrap tests)
 # ---------------------------------------------------------------------------
 
+# Precomputed stub output: fixed inputs, so the dict is built once at
+# import instead of per fake_run call. bootstrap mutates its copy of
+# "best" (metadata keys), hence the dict(...) in fake_run.
+_FAKE_BEST = {
+    "HASH_VARIANT": "argon2",
+    "ARGON2_TIME_COST": "3",
+    "ARGON2_MEMORY_COST": str(64 * 1024),
+    "ARGON2_PARALLELISM": "2",
+}
+_FAKE_SCHEMA_KEYS = ["time_cost", "memory_cost", "parallelism"]
+
+
 @pytest.fixture
 def stub_runner(monkeypatch):
     """
@@ -23,18 +35,11 @@ def stub_runner(monkeypatch):
             self.policy = Argon2Policy()  # default policy
 
     def fake_run(self):
-        best = {
-            "HASH_VARIANT": "argon2",
-            "ARGON2_TIME_COST": "3",
-            "ARGON2_MEMORY_COST": str(64 * 1024),
-            "ARGON2_PARALLELISM": "2",
-        }
-        fake = FakeResult()
         return {
-            "best": best,
-            "best_result": fake,
+            "best": dict(_FAKE_BEST),
+            "best_result": FakeResult(),
             "near": [],
-            "schema_keys": ["time_cost", "memory_cost", "parallelism"],
+            "schema_keys": _FAKE_SCHEMA_KEYS,
         }
 
     from securitykit.bench import runner as runner_mod
@@ -185,6 +190,13 @@ def test_export_excludes_pepper_keys(chdir_tmp, capture_logs, neutral_bench_sche
 
     ensure_env_config()
 
-    data = Path(".env.local").read_text()
-    assert "PEPPER_MODE" not in data
-    assert "PEPPER_HMAC_KEY" not in data
+    # Parse once into a key/value dict: O(1) key lookups instead of
+    # repeated substring scans over the whole file.
+    kv = dict(
+        line.split("=", 1)
+        for line in Path(".env.local").read_text().splitlines()
+        if "=" in line and not line.startswith("#")
+    )
+    assert "PEPPER_MODE" not in kv
+    assert "PEPPER_HMAC_KEY" not in kv
+    assert kv.get("HASH_VARIANT") == "argon2"
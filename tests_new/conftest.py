@@ -16,6 +16,7 @@ import logging
 from pathlib import Path
 import pytest
 
+from securitykit.config import build_clear_env_prefixes
 from securitykit.hashing.registry import load_all
 from securitykit.hashing import algorithm_registry, policy_registry
 
@@ -72,21 +73,69 @@ def registry_reset():
         pass
 
 
+# --- Shared algorithm instances ----------------------------------------------
+@pytest.fixture(scope="session")
+def shared_algorithm():
+    """
+    Session-cached Algorithm façade per variant, built with the
+    minimized-cost policy from BENCH_SCHEMA.
+
+    Use in read-only tests that assert hash/verify *semantics* — those
+    hold at the cheapest parameters, and KDF cost scales linearly with
+    memory/rounds, so this trims most of the per-hash wall time. Tests
+    that probe default-policy values, isolation, or custom config keep
+    using build_algorithm directly.
+    """
+    from .common.helpers import build_algorithm, build_lightweight_policy
+
+    cache: dict[str, object] = {}
+
+    def _get(name: str):
+        algo = cache.get(name)
+        if algo is None:
+            algo = cache[name] = build_algorithm(
+                name, policy=build_lightweight_policy(name)
+            )
+        return algo
+
+    return _get
+
+
 # --- Environment isolation ---------------------------------------------------
+# Families the suite mutates: policy/pepper/hash prefixes from config plus the
+# bootstrap/benchmark keys and metadata written to .env.local. Diff-based
+# restore below only saves values for these instead of copying all of
+# os.environ per test; anything a test *adds* is removed regardless of prefix.
+_TRACKED_ENV_PREFIXES = build_clear_env_prefixes() + (
+    "AUTO_BENCHMARK",
+    "SECURITYKIT_",
+    "GENERATED_",
+)
+
+
 @pytest.fixture(autouse=True)
 def restore_env_each_test():
     """
-    Automatically snapshot os.environ before each test and restore it afterwards.
+    Automatically isolate os.environ per test via diff-based restore.
 
-    Ensures tests cannot leak environment variable modifications into subsequent
-    tests (critical for config / pepper / benchmark related paths).
+    Keys added during a test are removed on teardown; tracked-prefix keys
+    that were modified or deleted are restored to their saved values.
+    This allocates O(tracked keys) instead of copying the whole
+    environment for every test. Tests must not modify untracked
+    pre-existing keys directly (use monkeypatch for those).
     """
-    snapshot = os.environ.copy()
+    keys_before = set(os.environ)
+    saved = {
+        k: v for k, v in os.environ.items() if k.startswith(_TRACKED_ENV_PREFIXES)
+    }
     try:
         yield
     finally:
-        os.environ.clear()
-        os.environ.update(snapshot)
+        for k in set(os.environ) - keys_before:
+            del os.environ[k]
+        for k, v in saved.items():
+            if os.environ.get(k) != v:
+                os.environ[k] = v
 
 
 # --- Common helpers: temp cwd & log capture ---------------------------------
@@ -122,6 +171,11 @@ def capture_logs():
 
 
 # --- Prevent real benchmarking in unit tests ---------------------------------
+# Real BenchmarkRunner.run, captured the first time forbid_real_benchmark
+# replaces it, so allow_real_benchmark can restore it without a module reload.
+_REAL_BENCHMARK_RUN = None
+
+
 @pytest.fixture(autouse=True)
 def forbid_real_benchmark(monkeypatch):
     """
@@ -132,7 +186,23 @@ def forbid_real_benchmark(monkeypatch):
 
     Fails fast with an AssertionError if the real runner is invoked.
     """
+    global _REAL_BENCHMARK_RUN
     import securitykit.bench.runner as runner_mod
+    if _REAL_BENCHMARK_RUN is None:
+        _REAL_BENCHMARK_RUN = runner_mod.BenchmarkRunner.run
     def blocked(self):  # noqa: D401 - short intentional
         raise AssertionError("Real BenchmarkRunner.run invoked in tests.")
     monkeypatch.setattr(runner_mod.BenchmarkRunner, "run", blocked)
+
+
+@pytest.fixture
+def allow_real_benchmark(forbid_real_benchmark, monkeypatch):
+    """
+    Restore the real BenchmarkRunner.run for tests that exercise the runner
+    itself (with a stubbed engine). Depends on forbid_real_benchmark to
+    guarantee it runs after the blocker; restoration is undone on teardown.
+    Returns the runner module (no importlib.reload needed).
+    """
+    import securitykit.bench.runner as runner_mod
+    monkeypatch.setattr(runner_mod.BenchmarkRunner, "run", _REAL_BENCHMARK_RUN)
+    return runner_mod
@@ -1,7 +1,7 @@
 import pytest
 from securitykit.hashing import algorithm_registry
 from securitykit.exceptions import HashingError
-from ..common.helpers import build_algorithm
+from ..common.helpers import VALID_PASSWORD, build_algorithm
 
 
 def test_reject_empty_password_on_hash(algorithm_name):
@@ -13,6 +13,29 @@ def test_reject_empty_password_on_hash(algorithm_name):
         algo.hash("")
 
 
+def test_verify_foreign_variant_hash_returns_false(algorithm_name):
+    """
+    A stored hash with a prefix belonging to another variant must be
+    rejected without raising (and without invoking the full KDF).
+    """
+    algo = build_algorithm(algorithm_name)
+    foreign = "$foreign$v=1$dummy"
+    assert algo.verify(foreign, VALID_PASSWORD) is False
+
+
+def test_constant_time_rejection_still_returns_false(algorithm_name):
+    """
+    constant_time mode balances rejection timing with a dummy KDF run but
+    must not change verify() results.
+    """
+    from ..common.helpers import build_lightweight_policy
+
+    policy = build_lightweight_policy(algorithm_name)
+    algo = build_algorithm(algorithm_name, policy=policy, constant_time=True)
+    assert algo.verify("", VALID_PASSWORD) is False
+    assert algo.verify("$foreign$v=1$dummy", VALID_PASSWORD) is False
+
+
 def test_invalid_policy_type_raises(algorithm_name):
     """
     Passing an object that is not the expected concrete policy should raise TypeError.
@@ -3,7 +3,7 @@ from securitykit.hashing import algorithm_registry
 from ..common.helpers import VALID_PASSWORD, build_algorithm
 
 
-def test_roundtrip_default_policy(algorithm_name):
+def test_roundtrip_default_policy(algorithm_name, shared_algorithm):
     """
     Basic roundtrip:
       - hash returns non-empty string
@@ -11,7 +11,7 @@ def test_roundtrip_default_policy(algorithm_name):
       - verify fails on modified password
       - needs_rehash returns a boolean
     """
-    algo = build_algorithm(algorithm_name)
+    algo = shared_algorithm(algorithm_name)
     h = algo.hash(VALID_PASSWORD)
     assert isinstance(h, str) and h
     assert algo.verify(h, VALID_PASSWORD) is True
@@ -0,0 +1,60 @@
+"""
+Direct unit tests for the pure Argon2 field validation helper, plus one
+integration check that policy construction routes warnings through logging.
+"""
+import pytest
+
+from securitykit.exceptions import InvalidPolicyConfig
+from securitykit.hashing.policies.argon2 import (
+    ARGON2_MIN_MEMORY,
+    ARGON2_MAX_PARALLELISM,
+    Argon2Policy,
+    validate_policy_fields,
+)
+
+
+def _validate(**overrides):
+    defaults = dict(
+        time_cost=2,
+        memory_cost=64 * 1024,
+        parallelism=2,
+        hash_length=32,
+        salt_length=16,
+    )
+    defaults.update(overrides)
+    return validate_policy_fields(**defaults)
+
+
+def test_recommended_values_produce_no_messages():
+    errors, warnings = _validate()
+    assert errors == []
+    assert warnings == []
+
+
+def test_below_minimum_is_an_error():
+    errors, _ = _validate(memory_cost=ARGON2_MIN_MEMORY - 1)
+    assert "memory_cost" in "\n".join(errors)
+
+
+def test_below_recommended_is_a_warning_not_error():
+    errors, warnings = _validate(time_cost=1, memory_cost=ARGON2_MIN_MEMORY)
+    assert errors == []
+    # Single join then substring checks instead of repeated any() scans.
+    joined = "\n".join(warnings)
+    for field in ("time_cost", "memory_cost"):
+        assert field in joined, f"missing warning for {field}"
+    assert "below recommended" in joined
+
+
+def test_above_maximum_is_a_warning():
+    _, warnings = _validate(parallelism=ARGON2_MAX_PARALLELISM + 1)
+    assert "parallelism" in "\n".join(warnings)
+
+
+def test_policy_construction_logs_warnings_and_raises_on_error(caplog):
+    caplog.set_level("WARNING", logger="securitykit")
+    Argon2Policy(time_cost=1)
+    assert "below recommended" in "\n".join(r.message for r in caplog.records)
+
+    with pytest.raises(InvalidPolicyConfig):
+        Argon2Policy(memory_cost=ARGON2_MIN_MEMORY - 1)
@@ -9,6 +9,7 @@ from securitykit.exceptions import (
     HashingError,
     VerificationError,
 )
+from ..common.helpers import VALID_PASSWORD
 
 
 def test_algorithm_delegate_hash_exception(monkeypatch):
@@ -21,7 +22,7 @@ def test_algorithm_delegate_hash_exception(monkeypatch):
     impl.hash_raw = boom  # type: ignore[attr-defined]
 
     with pytest.raises(HashingError):
-        algo.hash("Secret123!")
+        algo.hash(VALID_PASSWORD)
 
 
 def test_algorithm_delegate_verify_exception(monkeypatch):
@@ -33,7 +34,9 @@ def test_algorithm_delegate_verify_exception(monkeypatch):
     impl.verify_raw = vboom  # type: ignore[attr-defined]
 
     with pytest.raises(VerificationError):
-        algo.verify("dummy", "Secret123!")
+        # Prefix must match the variant, otherwise verify short-circuits
+        # to False before reaching the delegate.
+        algo.verify("$argon2id$dummy", VALID_PASSWORD)
 
 
 def test_algorithm_hash_empty_raises():
@@ -4,14 +4,14 @@ from ..common.helpers import VALID_PASSWORD, build_algorithm
 from ..common.parsers import parse_argon2, parse_bcrypt
 
 
-def test_hash_parameter_encoding_matches_policy(algorithm_name):
+def test_hash_parameter_encoding_matches_policy(algorithm_name, shared_algorithm):
     """
     For recognized algorithms:
       - Argon2: parse memory/time/parallelism and compare to policy
       - Bcrypt: parse cost rounds and compare to policy
     For unknown algorithms: ensure hash is non-empty (placeholder).
     """
-    algo = build_algorithm(algorithm_name)
+    algo = shared_algorithm(algorithm_name)
     h = algo.hash(VALID_PASSWORD)
 
     if algorithm_name == "argon2":
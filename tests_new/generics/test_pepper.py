@@ -1,5 +1,22 @@
 import pytest
-from ..common.helpers import VALID_PASSWORD, build_algorithm
+from securitykit.transform.pepper import apply_pepper, apply_pepper_digest
+from ..common.helpers import VALID_PASSWORD, build_algorithm, build_lightweight_policy
+
+
+def test_apply_pepper_digest_is_stable_and_strategy_bound():
+    """
+    Digest variant: fixed 32-byte output, deterministic for identical
+    config, and bound to the configured strategy (different config →
+    different digest).
+    """
+    cfg_a = {"PEPPER_MODE": "suffix", "PEPPER_SUFFIX": "_S3CRET"}
+    cfg_b = {"PEPPER_MODE": "suffix", "PEPPER_SUFFIX": "_OTHER"}
+    d1 = apply_pepper_digest(VALID_PASSWORD, cfg_a)
+    d2 = apply_pepper_digest(VALID_PASSWORD, cfg_a)
+    d3 = apply_pepper_digest(VALID_PASSWORD, cfg_b)
+    assert isinstance(d1, bytes) and len(d1) == 32
+    assert d1 == d2
+    assert d1 != d3
 
 
 @pytest.mark.parametrize(
@@ -7,6 +24,7 @@ from ..common.helpers import VALID_PASSWORD, build_algorithm
     [
         ({"PEPPER_MODE": "suffix", "PEPPER_SUFFIX": "_S3CRET"}, "suffix"),
         ({"PEPPER_MODE": "hmac", "PEPPER_HMAC_KEY": "supersecretkey"}, "hmac"),
+        ({"PEPPER_MODE": "blake2", "PEPPER_HMAC_KEY": "supersecretkey"}, "blake2"),
     ],
 )
 def test_pepper_changes_hash_and_verification_behavior(algorithm_name, pepper_cfg, label):
@@ -19,12 +37,16 @@ def test_pepper_changes_hash_and_verification_behavior(algorithm_name, pepper_cf
       - Plain hash verifies only with the plain algorithm instance
       - Cross verification fails in both directions
     """
+    # Minimized-cost policy: the assertions concern pepper semantics, not
+    # KDF strength, and this test hashes four times per parametrization.
+    policy = build_lightweight_policy(algorithm_name)
+
     # Plain (no PEPPER_* keys)
-    plain_algo = build_algorithm(algorithm_name)
+    plain_algo = build_algorithm(algorithm_name, policy=policy)
     plain_hash = plain_algo.hash(VALID_PASSWORD)
 
     # Pepper-enabled (only PEPPER_* keys + variant implicit via façade arg)
-    pepper_algo = build_algorithm(algorithm_name, config=pepper_cfg)
+    pepper_algo = build_algorithm(algorithm_name, policy=policy, config=pepper_cfg)
     pepper_hash = pepper_algo.hash(VALID_PASSWORD)
 
     assert plain_hash != pepper_hash, f"Pepper strategy '{label}' did not alter hash output"
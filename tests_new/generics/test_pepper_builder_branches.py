@@ -8,7 +8,7 @@ from securitykit.exceptions import PepperConfigError, UnknownPepperStrategyError
 def test_pepper_unknown_mode_fallback_noop(caplog):
     out = apply_pepper("secret", {"PEPPER_MODE": "doesnotexist"})
     assert out == "secret"
-    assert any("fallback" in r.message.lower() for r in caplog.records)
+    assert "fallback" in caplog.text.lower()
 
 
 def test_pepper_interleave_freq_zero():
@@ -24,7 +24,7 @@ def test_pepper_hmac_missing_key_raises():
 
 def test_pepper_hmac_short_key_warning(caplog):
     apply_pepper("pw", {"PEPPER_MODE": "hmac", "PEPPER_HMAC_KEY": "short"})
-    assert any("short" in r.message.lower() for r in caplog.records)
+    assert "short" in caplog.text.lower()
 
 
 def test_pepper_unsupported_hmac_algo():
@@ -1,6 +1,6 @@
 import pytest
 from securitykit.hashing import algorithm_registry, policy_registry
-from ..common.helpers import VALID_PASSWORD, build_algorithm
+from ..common.helpers import VALID_PASSWORD, build_algorithm, build_lightweight_policy
 
 
 def test_rehash_when_policy_parameter_increases(algorithm_name):
@@ -10,13 +10,17 @@ def test_rehash_when_policy_parameter_increases(algorithm_name):
       - Increase it if possible.
       - Check needs_rehash result (True or False).
       - If True, hash again and ensure new hash differs & verifies.
+
+    Starts from the minimized-cost policy: rehash detection compares
+    encoded parameters, so the scenario is identical at minimum cost and
+    a larger schema candidate is guaranteed to exist above the minimum.
     """
     PolicyCls = policy_registry.get_policy_class(algorithm_name)
     schema = getattr(PolicyCls, "BENCH_SCHEMA", {})
     if not schema:
         pytest.skip("Policy has no BENCH_SCHEMA; cannot synthesize rehash scenario.")
 
-    base_policy = PolicyCls()
+    base_policy = build_lightweight_policy(algorithm_name)
     algo1 = build_algorithm(algorithm_name, base_policy)
     h1 = algo1.hash(VALID_PASSWORD)
 
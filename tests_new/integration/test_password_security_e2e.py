@@ -5,7 +5,7 @@ Skipped automatically if the module is not installed/available.
 import importlib
 import pytest
 
-VALID_PW = "Aa1!abcd!"
+from ..common.helpers import VALID_PASSWORD as VALID_PW
 
 
 @pytest.mark.skipif(